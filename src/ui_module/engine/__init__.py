@@ -4,6 +4,8 @@ from .adapters import JsonAdapter, McpUiAdapter, RenderAdapter, RenderResult
 from .config import ConfigLoader, UISettings, ViewDefinition
 from .envelope import ContextEnvelope
 from .models import (
+    COMPONENT_TYPE_NAMES,
+    COMPONENT_TYPES_BY_NAME,
     ChartType,
     ComponentConfig,
     ComponentType,
@@ -21,6 +23,8 @@ from .view_manager import ViewManager
 __all__ = [
     # Models
     "ComponentType",
+    "COMPONENT_TYPE_NAMES",
+    "COMPONENT_TYPES_BY_NAME",
     "ChartType",
     "ComponentConfig",
     "UIComponent",
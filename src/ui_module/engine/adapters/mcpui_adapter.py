@@ -7,12 +7,18 @@ within the chat interface.
 See: https://mcpui.dev/
 """
 
+import json
+from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
-from ..models import ComponentType, UIComponent, UIView
+from ..models import COMPONENT_TYPE_NAMES, ComponentType, UIComponent, UIView
 from .base import RenderAdapter, RenderResult
 
+# Lookup tables used by the component renderers
+_TEXT_TAGS = {"h1": "h1", "h2": "h2", "h3": "h3", "body": "p", "caption": "span"}
+_TREND_ICONS = {"up": "↑", "down": "↓", "flat": "→"}
+
 
 class UIResourceType(str, Enum):
     """MCP-UI resource types."""
@@ -34,6 +40,20 @@ class McpUiAdapter(RenderAdapter):
 
     def __init__(self, resource_type: UIResourceType = UIResourceType.INLINE_HTML) -> None:
         self._resource_type = resource_type
+        # Built once; looked up per component while rendering
+        self._renderers: dict[ComponentType, Callable[[UIComponent], str]] = {
+            ComponentType.TEXT: self._render_text,
+            ComponentType.CHART: self._render_chart,
+            ComponentType.TABLE: self._render_table,
+            ComponentType.METRIC: self._render_metric,
+            ComponentType.CARD: self._render_card,
+            ComponentType.ALERT: self._render_alert,
+            ComponentType.PROGRESS: self._render_progress,
+            ComponentType.FORM: self._render_form,
+            ComponentType.BUTTON: self._render_button,
+            ComponentType.IMAGE: self._render_image,
+            ComponentType.LIST: self._render_list,
+        }
 
     @property
     def adapter_type(self) -> str:
@@ -76,7 +96,7 @@ class McpUiAdapter(RenderAdapter):
             "content": html,
             "metadata": {
                 "component_id": component.id,
-                "component_type": component.component_type.value,
+                "component_type": COMPONENT_TYPE_NAMES[component.component_type],
             },
         }
 
@@ -88,7 +108,11 @@ class McpUiAdapter(RenderAdapter):
 
     def _view_to_html(self, view: UIView) -> str:
         """Convert view to HTML string."""
-        components_html = "\n".join(self._component_to_html(c) for c in view.components)
+        renderers = self._renderers
+        render_custom = self._render_custom
+        components_html = "\n".join(
+            renderers.get(c.component_type, render_custom)(c) for c in view.components
+        )
 
         styles = self._generate_styles(view)
 
@@ -107,28 +131,16 @@ class McpUiAdapter(RenderAdapter):
         renderer = self._get_component_renderer(component.component_type)
         return renderer(component)
 
-    def _get_component_renderer(self, component_type: ComponentType):
+    def _get_component_renderer(
+        self, component_type: ComponentType
+    ) -> Callable[[UIComponent], str]:
         """Get the HTML renderer for a component type."""
-        renderers = {
-            ComponentType.TEXT: self._render_text,
-            ComponentType.CHART: self._render_chart,
-            ComponentType.TABLE: self._render_table,
-            ComponentType.METRIC: self._render_metric,
-            ComponentType.CARD: self._render_card,
-            ComponentType.ALERT: self._render_alert,
-            ComponentType.PROGRESS: self._render_progress,
-            ComponentType.FORM: self._render_form,
-            ComponentType.BUTTON: self._render_button,
-            ComponentType.IMAGE: self._render_image,
-            ComponentType.LIST: self._render_list,
-        }
-        return renderers.get(component_type, self._render_custom)
+        return self._renderers.get(component_type, self._render_custom)
 
     def _render_text(self, c: UIComponent) -> str:
         variant = c.props.get("variant", "body")
         content = c.props.get("content", "")
-        tag_map = {"h1": "h1", "h2": "h2", "h3": "h3", "body": "p", "caption": "span"}
-        tag = tag_map.get(variant, "p")
+        tag = _TEXT_TAGS.get(variant, "p")
         style = self._styles_to_css(c.styles)
         return (
             f'<{tag} class="mcp-ui-text mcp-ui-text--{variant}" style="{style}">{content}</{tag}>'
@@ -174,7 +186,7 @@ data-component-id="{c.id}">
 
         trend_html = ""
         if trend:
-            trend_icon = {"up": "↑", "down": "↓", "flat": "→"}.get(trend, "")
+            trend_icon = _TREND_ICONS.get(trend, "")
             trend_class = f"trend--{trend}"
             trend_html = (
                 f'<span class="metric-trend {trend_class}">{trend_icon} {trend_value}</span>'
@@ -263,7 +275,7 @@ data-component-id="{c.id}">
         return f'<{tag} class="mcp-ui-list" data-component-id="{c.id}">{items_html}</{tag}>'
 
     def _render_custom(self, c: UIComponent) -> str:
-        data_type = c.component_type.value
+        data_type = COMPONENT_TYPE_NAMES[c.component_type]
         json_props = self._json_encode(c.props)
         return (
             f'<div class="mcp-ui-custom" data-component-id="{c.id}" '
@@ -307,6 +319,4 @@ data-component-id="{c.id}">
 """
 
     def _json_encode(self, data: Any) -> str:
-        import json
-
         return json.dumps(data)
@@ -3,18 +3,74 @@
 Supports config_dir pattern for portable, config-driven behavior.
 """
 
+import copy
+import functools
+import json
 import logging
 import os
+import stat
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
-import yaml
-
 from .models import ComponentType, UIComponent, UIView
 
 logger = logging.getLogger(__name__)
 
+_VIEW_SUFFIXES = (".yaml", ".yml", ".json")
+
+
+@functools.cache
+def _yaml() -> ModuleType:
+    """Import PyYAML on first use, so JSON-only configs never load it."""
+    import yaml
+
+    return yaml
+
+
+@functools.cache
+def yaml_loader() -> Any:
+    """libyaml's C loader when PyYAML was built with it, pure Python otherwise."""
+    yaml = _yaml()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=2000)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML or JSON file; mtime and size in the key invalidate edits."""
+    with open(path) as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        return _yaml().load(f, Loader=yaml_loader())
+
+
+def _load_config_file(path: Path, st: os.stat_result | None = None) -> Any:
+    """Load a YAML or JSON file through the parse cache.
+
+    ``st`` may be passed when the caller already has the file's stat result.
+    Returns a deep copy so callers may mutate the result freely.
+    """
+    if st is None:
+        st = path.stat()
+    return copy.deepcopy(_parse_config_file(os.path.abspath(path), st.st_mtime_ns, st.st_size))
+
+
+def config_cache_info() -> dict[str, int]:
+    """Report hit/miss counters for the config file parse cache."""
+    info = _parse_config_file.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize or 0,
+    }
+
+
+def clear_config_cache() -> None:
+    """Drop cached config file parses (for testing)."""
+    _parse_config_file.cache_clear()
+
 
 @dataclass
 class UISettings:
@@ -110,6 +166,70 @@ class ViewDefinition:
         )
 
 
+# JSON schema for settings.yaml and view files
+_CONFIG_SCHEMA: dict[str, Any] = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "UI Module Configuration",
+    "type": "object",
+    "properties": {
+        "settings": {
+            "type": "object",
+            "properties": {
+                "authoring_enabled": {"type": "boolean", "default": False},
+                "push_enabled": {"type": "boolean", "default": True},
+                "max_clients": {"type": "integer", "default": 100},
+                "storage_backend": {
+                    "type": "string",
+                    "enum": ["memory", "redis", "filesystem"],
+                },
+                "storage_path": {"type": "string"},
+                "default_adapter": {"type": "string", "default": "json"},
+                "enabled_adapters": {"type": "array", "items": {"type": "string"}},
+                "max_views": {"type": "integer", "default": 1000},
+                "max_components_per_view": {"type": "integer", "default": 100},
+                "max_history_entries": {"type": "integer", "default": 1000},
+                "feature_flags": {
+                    "type": "object",
+                    "additionalProperties": {"type": "boolean"},
+                },
+            },
+        },
+        "view_definition": {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string"},
+                "description": {"type": "string"},
+                "layout": {
+                    "type": "object",
+                    "properties": {
+                        "type": {"type": "string", "enum": ["flex", "grid"]},
+                        "columns": {"type": "integer"},
+                        "direction": {"type": "string"},
+                    },
+                },
+                "components": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["type"],
+                        "properties": {
+                            "id": {"type": "string"},
+                            "type": {"type": "string"},
+                            "props": {"type": "object"},
+                            "styles": {"type": "object"},
+                        },
+                    },
+                },
+                "metadata": {"type": "object"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+        },
+    },
+}
+
+
 class ConfigLoader:
     """Loads configuration from config_dir.
 
@@ -123,6 +243,8 @@ class ConfigLoader:
 
     def __init__(self, config_dir: str | Path | None = None):
         self.config_dir = Path(config_dir) if config_dir else self._default_config_dir()
+        # Resolved once; every loaded file is checked against it
+        self._config_root = str(self.config_dir.resolve())
         self._settings: UISettings | None = None
         self._view_definitions: dict[str, ViewDefinition] = {}
 
@@ -138,13 +260,25 @@ class ConfigLoader:
 
     def _validate_path(self, path: Path) -> None:
         """Validate path is within config_dir (traversal protection)."""
+        # Checked before resolve(), which would follow the link
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            raise ValueError(f"Invalid path: {path}") from e
+        else:
+            if stat.S_ISLNK(st.st_mode):
+                raise ValueError(f"Symlink rejected: {path}")
+
         try:
-            resolved = path.resolve()
-            config_resolved = self.config_dir.resolve()
+            resolved = str(path.resolve())
         except Exception as e:
             raise ValueError(f"Invalid path: {path}") from e
 
-        if not str(resolved).startswith(str(config_resolved)):
+        # Component-wise, so a sibling like "config-other" is not accepted
+        root = self._config_root
+        if os.path.commonpath((root, resolved)) != root:
             raise ValueError(f"Path traversal detected: {path}")
 
     def load_settings(self) -> UISettings:
@@ -161,8 +295,7 @@ class ConfigLoader:
 
         self._validate_path(settings_path)
 
-        with open(settings_path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _load_config_file(settings_path) or {}
 
         # Override with environment variables
         if os.environ.get("AUTHORING_ENABLED", "").lower() == "true":
@@ -172,39 +305,57 @@ class ConfigLoader:
         logger.info(f"Loaded settings from {settings_path}")
         return self._settings
 
-    def load_view_definitions(self) -> dict[str, ViewDefinition]:
-        """Load view definitions from config/views/*.yaml."""
-        if self._view_definitions:
-            return self._view_definitions
-
+    def _view_files(self) -> list[tuple[Path, os.stat_result]]:
+        """List view files under config/views with their stat results."""
         views_dir = self.config_dir / "views"
 
         if not views_dir.exists():
             logger.info(f"No views directory at {views_dir}")
-            return {}
+            return []
 
         self._validate_path(views_dir)
 
-        for yaml_file in views_dir.glob("*.yaml"):
-            self._validate_path(yaml_file)
+        # Regular files directly inside the validated views dir cannot escape
+        # config_dir, so entries need no per-file resolve()
+        files = []
+        with os.scandir(views_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(_VIEW_SUFFIXES):
+                    continue
+                if entry.is_symlink():
+                    logger.warning(f"Skipping symlinked view file: {entry.path}")
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    files.append((Path(entry.path), entry.stat(follow_symlinks=False)))
+        return files
+
+    def load_view_definition(self, path: Path, st: os.stat_result | None = None) -> ViewDefinition:
+        """Load a single view definition file."""
+        data = _load_config_file(path, st) or {}
+
+        view_id = data.get("id", path.stem)
+        return ViewDefinition(
+            id=view_id,
+            name=data.get("name", view_id),
+            description=data.get("description", ""),
+            layout=data.get("layout", {}),
+            components=data.get("components", []),
+            metadata=data.get("metadata", {}),
+            tags=data.get("tags", []),
+        )
+
+    def load_view_definitions(self) -> dict[str, ViewDefinition]:
+        """Load view definitions from config/views/*.yaml (or *.yml, *.json)."""
+        if self._view_definitions:
+            return self._view_definitions
+
+        for view_file, st in self._view_files():
             try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f) or {}
-
-                view_id = data.get("id", yaml_file.stem)
-                definition = ViewDefinition(
-                    id=view_id,
-                    name=data.get("name", view_id),
-                    description=data.get("description", ""),
-                    layout=data.get("layout", {}),
-                    components=data.get("components", []),
-                    metadata=data.get("metadata", {}),
-                    tags=data.get("tags", []),
-                )
-                self._view_definitions[view_id] = definition
-                logger.debug(f"Loaded view definition: {view_id}")
+                definition = self.load_view_definition(view_file, st)
+                self._view_definitions[definition.id] = definition
+                logger.debug(f"Loaded view definition: {definition.id}")
             except Exception as e:
-                logger.error(f"Failed to load view from {yaml_file}: {e}")
+                logger.error(f"Failed to load view from {view_file}: {e}")
 
         logger.info(f"Loaded {len(self._view_definitions)} view definitions")
         return self._view_definitions
@@ -218,64 +369,4 @@ class ConfigLoader:
 
     def get_config_schema(self) -> dict[str, Any]:
         """Get JSON schema for configuration."""
-        return {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "UI Module Configuration",
-            "type": "object",
-            "properties": {
-                "settings": {
-                    "type": "object",
-                    "properties": {
-                        "authoring_enabled": {"type": "boolean", "default": False},
-                        "push_enabled": {"type": "boolean", "default": True},
-                        "max_clients": {"type": "integer", "default": 100},
-                        "storage_backend": {
-                            "type": "string",
-                            "enum": ["memory", "redis", "filesystem"],
-                        },
-                        "storage_path": {"type": "string"},
-                        "default_adapter": {"type": "string", "default": "json"},
-                        "enabled_adapters": {"type": "array", "items": {"type": "string"}},
-                        "max_views": {"type": "integer", "default": 1000},
-                        "max_components_per_view": {"type": "integer", "default": 100},
-                        "max_history_entries": {"type": "integer", "default": 1000},
-                        "feature_flags": {
-                            "type": "object",
-                            "additionalProperties": {"type": "boolean"},
-                        },
-                    },
-                },
-                "view_definition": {
-                    "type": "object",
-                    "required": ["id", "name"],
-                    "properties": {
-                        "id": {"type": "string"},
-                        "name": {"type": "string"},
-                        "description": {"type": "string"},
-                        "layout": {
-                            "type": "object",
-                            "properties": {
-                                "type": {"type": "string", "enum": ["flex", "grid"]},
-                                "columns": {"type": "integer"},
-                                "direction": {"type": "string"},
-                            },
-                        },
-                        "components": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "required": ["type"],
-                                "properties": {
-                                    "id": {"type": "string"},
-                                    "type": {"type": "string"},
-                                    "props": {"type": "object"},
-                                    "styles": {"type": "object"},
-                                },
-                            },
-                        },
-                        "metadata": {"type": "object"},
-                        "tags": {"type": "array", "items": {"type": "string"}},
-                    },
-                },
-            },
-        }
+        return copy.deepcopy(_CONFIG_SCHEMA)
@@ -8,7 +8,7 @@ All operational tools accept this envelope to enable:
 """
 
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any
 
@@ -19,7 +19,7 @@ MAX_ATTRIBUTE_VALUE_LENGTH = 256
 ALLOWED_ATTRIBUTE_TYPES = (str, int, float, bool)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContextEnvelope:
     """Common context envelope for operational tools.
 
@@ -55,16 +55,23 @@ class ContextEnvelope:
         self._validate_attributes()
 
     def _validate_attributes(self) -> None:
-        """Validate attribute constraints."""
-        if len(self.attributes) > MAX_ATTRIBUTES:
-            raise ValueError(f"Too many attributes: {len(self.attributes)} > {MAX_ATTRIBUTES}")
-
-        for key, value in self.attributes.items():
+        """Validate attribute constraints in a single pass."""
+        attributes = self.attributes
+        if not attributes:
+            return
+        if len(attributes) > MAX_ATTRIBUTES:
+            raise ValueError(f"Too many attributes: {len(attributes)} > {MAX_ATTRIBUTES}")
+
+        for key, value in attributes.items():
             if len(key) > MAX_ATTRIBUTE_KEY_LENGTH:
                 raise ValueError(f"Attribute key too long: {len(key)} > {MAX_ATTRIBUTE_KEY_LENGTH}")
 
-            if not isinstance(value, ALLOWED_ATTRIBUTE_TYPES):
-                raise ValueError(f"Invalid attribute type for '{key}': {type(value).__name__}")
+            # Exact type match first; isinstance only for subclasses
+            value_type = type(value)
+            if value_type not in ALLOWED_ATTRIBUTE_TYPES and not isinstance(
+                value, ALLOWED_ATTRIBUTE_TYPES
+            ):
+                raise ValueError(f"Invalid attribute type for '{key}': {value_type.__name__}")
 
             if isinstance(value, str) and len(value) > MAX_ATTRIBUTE_VALUE_LENGTH:
                 raise ValueError(
@@ -112,16 +119,4 @@ class ContextEnvelope:
 
     def with_tool(self, tool_name: str) -> "ContextEnvelope":
         """Create a copy with tool_name set."""
-        return ContextEnvelope(
-            tenant_id=self.tenant_id,
-            principal_id=self.principal_id,
-            session_id=self.session_id,
-            request_id=self.request_id,
-            correlation_id=self.correlation_id,
-            view_id=self.view_id,
-            client_id=self.client_id,
-            agent_id=self.agent_id,
-            tool_name=tool_name,
-            timestamp=self.timestamp,
-            attributes=self.attributes.copy(),
-        )
+        return replace(self, tool_name=tool_name, attributes=self.attributes.copy())
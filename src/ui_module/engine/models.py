@@ -23,6 +23,13 @@ class ComponentType(str, Enum):
     CUSTOM = "custom"
 
 
+# Plain dict lookups; cheaper than Enum ``.value`` access and ComponentType(name)
+COMPONENT_TYPE_NAMES: dict[ComponentType, str] = {ct: ct.value for ct in ComponentType}
+COMPONENT_TYPES_BY_NAME: dict[str, ComponentType] = {
+    name: ct for ct, name in COMPONENT_TYPE_NAMES.items()
+}
+
+
 class ChartType(str, Enum):
     """Chart subtypes."""
 
@@ -34,7 +41,7 @@ class ChartType(str, Enum):
     DONUT = "donut"
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentConfig:
     """Configuration for a UI component."""
 
@@ -44,7 +51,7 @@ class ComponentConfig:
     children: list["UIComponent"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class UIComponent:
     """A renderable UI component."""
 
@@ -55,18 +62,44 @@ class UIComponent:
     children: list["UIComponent"] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    # (updated_at, dict) from the last to_dict() call
+    _dict_cache: tuple[datetime, dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (updated_at, isoformat) for updated_at_iso
+    _iso_cache: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def updated_at_iso(self) -> str:
+        """``updated_at`` in ISO 8601 form, formatted once per change."""
+        cache = self._iso_cache
+        if cache is None or cache[0] is not self.updated_at:
+            cache = self._iso_cache = (self.updated_at, self.updated_at.isoformat())
+        return cache[1]
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+        """Convert to dictionary for serialization.
+
+        The result is cached until ``updated_at`` is reassigned, which every
+        mutation does, so callers must treat it as read-only.
+        """
+        cache = self._dict_cache
+        if cache is not None and cache[0] is self.updated_at:
+            return cache[1]
+
+        data = {
             "id": self.id,
-            "type": self.component_type.value,
+            "type": COMPONENT_TYPE_NAMES[self.component_type],
             "props": self.props,
             "styles": self.styles,
             "children": [c.to_dict() for c in self.children],
             "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "updated_at": self.updated_at_iso,
         }
+        self._dict_cache = (self.updated_at, data)
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "UIComponent":
@@ -86,7 +119,7 @@ class UIComponent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UIView:
     """A complete view/page containing components."""
 
@@ -98,10 +131,63 @@ class UIView:
     version: int = 1
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    # (version, updated_at, dict) from the last to_dict() call
+    _dict_cache: tuple[int, datetime, dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (updated_at, isoformat) for updated_at_iso
+    _iso_cache: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # component id -> position, checked on every hit and rebuilt when stale
+    _component_index: dict[str, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def updated_at_iso(self) -> str:
+        """``updated_at`` in ISO 8601 form, formatted once per change."""
+        cache = self._iso_cache
+        if cache is None or cache[0] is not self.updated_at:
+            cache = self._iso_cache = (self.updated_at, self.updated_at.isoformat())
+        return cache[1]
+
+    def find_component(self, component_id: str) -> int | None:
+        """Return the position of the component with ``component_id``, if any.
+
+        ``components`` is a plain list that callers may edit directly, so a
+        cached position is only trusted after checking the id at that slot;
+        otherwise the index is rebuilt once.
+        """
+        components = self.components
+        index = self._component_index
+        if index is not None:
+            position = index.get(component_id)
+            if (
+                position is not None
+                and position < len(components)
+                and components[position].id == component_id
+            ):
+                return position
+
+        index = {}
+        for position, component in enumerate(components):
+            index.setdefault(component.id, position)
+        self._component_index = index
+        return index.get(component_id)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+        """Convert to dictionary for serialization.
+
+        The result is cached until the view is saved again (which bumps
+        ``version`` and ``updated_at``); unchanged components reuse their own
+        cached dicts. Callers must treat the result as read-only.
+        """
+        cache = self._dict_cache
+        if cache is not None and cache[0] == self.version and cache[1] is self.updated_at:
+            return cache[2]
+
+        data = {
             "id": self.id,
             "name": self.name,
             "components": [c.to_dict() for c in self.components],
@@ -109,8 +195,10 @@ class UIView:
             "metadata": self.metadata,
             "version": self.version,
             "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "updated_at": self.updated_at_iso,
         }
+        self._dict_cache = (self.version, self.updated_at, data)
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "UIView":
@@ -131,25 +219,39 @@ class UIView:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ViewUpdate:
     """An update to push to connected clients."""
 
     view_id: str
-    action: str  # "full", "patch", "add_component", "remove_component", "update_component"
+    action: str  # "full", "patch", "add_component(s)", "remove_component", "update_component"
     payload: dict[str, Any]
     version: int
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    # (version, timestamp, dict) from the last to_dict() call
+    _dict_cache: tuple[int, datetime, dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+        """Convert to dictionary for serialization.
+
+        Updates are not modified once recorded, so the result is built once
+        and reused by every history read. Callers must treat it as read-only.
+        """
+        cache = self._dict_cache
+        if cache is not None and cache[0] == self.version and cache[1] is self.timestamp:
+            return cache[2]
+
+        data = {
             "view_id": self.view_id,
             "action": self.action,
             "payload": self.payload,
             "version": self.version,
             "timestamp": self.timestamp.isoformat(),
         }
+        self._dict_cache = (self.version, self.timestamp, data)
+        return data
 
 
 class ViewStore(Protocol):
@@ -172,7 +274,7 @@ class ViewStore(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """Session state for memory store (legacy - not currently used)."""
 
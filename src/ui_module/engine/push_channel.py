@@ -57,6 +57,9 @@ class PushChannel:
         self._clients: dict[str, ClientConnection] = {}
         self._queues: dict[str, asyncio.Queue[ViewUpdate]] = {}
         self._broadcast_callbacks: list[Callable[[ViewUpdate], Awaitable[None]]] = []
+        # Reverse index of subscriptions so a push only visits matching clients
+        self._view_index: dict[str, set[str]] = {}
+        self._wildcard: set[str] = set()
 
     def connect(
         self,
@@ -66,6 +69,10 @@ class PushChannel:
         metadata: dict[str, Any] | None = None,
     ) -> ClientConnection:
         """Register a new client connection."""
+        previous = self._clients.get(client_id)
+        if previous is not None:
+            self._unindex_client(client_id, previous)
+
         connection = ClientConnection(
             client_id=client_id,
             channel_type=channel_type,
@@ -79,60 +86,103 @@ class PushChannel:
 
     def disconnect(self, client_id: str) -> bool:
         """Disconnect a client."""
-        if client_id in self._clients:
-            del self._clients[client_id]
+        connection = self._clients.pop(client_id, None)
+        if connection is not None:
             del self._queues[client_id]
+            self._unindex_client(client_id, connection)
             logger.info(f"Client disconnected: {client_id}")
             return True
         return False
 
     def subscribe(self, client_id: str, view_id: str) -> bool:
         """Subscribe a client to view updates."""
-        if client_id in self._clients:
-            self._clients[client_id].subscribed_views.add(view_id)
-            self._clients[client_id].last_activity = datetime.utcnow()
+        connection = self._clients.get(client_id)
+        if connection is not None:
+            connection.subscribed_views.add(view_id)
+            connection.last_activity = datetime.utcnow()
+            if view_id == "*":
+                self._wildcard.add(client_id)
+            else:
+                self._view_index.setdefault(view_id, set()).add(client_id)
             logger.debug(f"Client {client_id} subscribed to view {view_id}")
             return True
         return False
 
     def unsubscribe(self, client_id: str, view_id: str) -> bool:
         """Unsubscribe a client from view updates."""
-        if client_id in self._clients:
-            self._clients[client_id].subscribed_views.discard(view_id)
-            self._clients[client_id].last_activity = datetime.utcnow()
+        connection = self._clients.get(client_id)
+        if connection is not None:
+            connection.subscribed_views.discard(view_id)
+            connection.last_activity = datetime.utcnow()
+            self._unindex(client_id, view_id)
             return True
         return False
 
+    def _unindex(self, client_id: str, view_id: str) -> None:
+        """Remove one subscription from the reverse index."""
+        if view_id == "*":
+            self._wildcard.discard(client_id)
+            return
+        subscribers = self._view_index.get(view_id)
+        if subscribers is not None:
+            subscribers.discard(client_id)
+            if not subscribers:
+                del self._view_index[view_id]
+
+    def _unindex_client(self, client_id: str, connection: ClientConnection) -> None:
+        """Remove all of a client's subscriptions from the reverse index."""
+        for view_id in connection.subscribed_views:
+            self._unindex(client_id, view_id)
+
+    def _subscriber_ids(self, view_id: str) -> tuple[str, ...]:
+        """IDs of clients subscribed to a view directly or via "*"."""
+        subscribers = self._view_index.get(view_id)
+        if subscribers:
+            return tuple(subscribers | self._wildcard)
+        return tuple(self._wildcard)
+
     async def push(self, update: ViewUpdate) -> int:
         """Push an update to all subscribed clients.
 
         Returns the number of clients that received the update.
         """
         recipients = 0
+        connections = [
+            self._clients[client_id] for client_id in self._subscriber_ids(update.view_id)
+        ]
 
-        for client_id, connection in self._clients.items():
-            # Check if client is subscribed to this view (or subscribed to "*" for all)
-            if update.view_id in connection.subscribed_views or "*" in connection.subscribed_views:
-                try:
-                    if connection.callback:
-                        await connection.callback(update)
-                    else:
-                        await self._queues[client_id].put(update)
-                    connection.last_activity = datetime.utcnow()
-                    recipients += 1
-                except Exception as e:
-                    logger.error(f"Failed to push to client {client_id}: {e}")
+        # Deliver concurrently; one failing client does not hold up the rest
+        results = await asyncio.gather(
+            *(self._deliver(connection, update) for connection in connections),
+            return_exceptions=True,
+        )
+        now = datetime.utcnow()
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to push to client {connection.client_id}: {result}")
+            else:
+                connection.last_activity = now
+                recipients += 1
 
         # Also call broadcast callbacks
-        for callback in self._broadcast_callbacks:
-            try:
-                await callback(update)
-            except Exception as e:
-                logger.error(f"Broadcast callback failed: {e}")
+        results = await asyncio.gather(
+            *(callback(update) for callback in self._broadcast_callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Broadcast callback failed: {result}")
 
         logger.debug(f"Pushed update for view {update.view_id} to {recipients} clients")
         return recipients
 
+    async def _deliver(self, connection: ClientConnection, update: ViewUpdate) -> None:
+        """Deliver an update to one client's callback or queue."""
+        if connection.callback:
+            await connection.callback(update)
+        else:
+            await self._queues[connection.client_id].put(update)
+
     async def get_update(self, client_id: str, timeout: float | None = None) -> ViewUpdate | None:
         """Get the next update for a client (for polling/SSE)."""
         if client_id not in self._queues:
@@ -163,11 +213,7 @@ class PushChannel:
 
     def get_subscribers(self, view_id: str) -> list[ClientConnection]:
         """Get all clients subscribed to a view."""
-        return [
-            c
-            for c in self._clients.values()
-            if view_id in c.subscribed_views or "*" in c.subscribed_views
-        ]
+        return [self._clients[client_id] for client_id in self._subscriber_ids(view_id)]
 
     def to_dict(self) -> dict[str, Any]:
         """Export channel state."""
@@ -1,189 +1,229 @@
 """Component registry for managing UI component definitions."""
 
-from dataclasses import dataclass, field
+import functools
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Callable
 
-from .models import ComponentType, UIComponent
+from .models import COMPONENT_TYPE_NAMES, ComponentType, UIComponent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ComponentDefinition:
     """Definition of a registered component type."""
 
     component_type: ComponentType
     name: str
     description: str
-    schema: dict[str, Any]  # JSON Schema for props validation
-    default_props: dict[str, Any] = field(default_factory=dict)
-    default_styles: dict[str, str] = field(default_factory=dict)
+    schema: Mapping[str, Any]  # JSON Schema for props validation
+    default_props: Mapping[str, Any] = field(default_factory=dict)
+    default_styles: Mapping[str, str] = field(default_factory=dict)
     validator: Callable[[dict[str, Any]], bool] | None = None
     registered_at: datetime = field(default_factory=datetime.utcnow)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "type": self.component_type.value,
+            "type": COMPONENT_TYPE_NAMES[self.component_type],
             "name": self.name,
             "description": self.description,
-            "schema": self.schema,
-            "default_props": self.default_props,
-            "default_styles": self.default_styles,
+            "schema": _thaw(self.schema),
+            "default_props": _thaw(self.default_props),
+            "default_styles": _thaw(self.default_styles),
             "registered_at": self.registered_at.isoformat(),
         }
 
 
-class ComponentRegistry:
-    """Registry for UI component definitions.
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
-    Manages available component types and their schemas,
-    allowing agents to discover what UI primitives are available.
-    """
 
-    def __init__(self) -> None:
-        self._components: dict[ComponentType, ComponentDefinition] = {}
-        self._register_builtins()
-
-    def _register_builtins(self) -> None:
-        """Register built-in component types."""
-        builtins = [
-            ComponentDefinition(
-                component_type=ComponentType.TEXT,
-                name="Text",
-                description="Display text content with optional formatting",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "content": {"type": "string"},
-                        "variant": {
-                            "type": "string",
-                            "enum": ["h1", "h2", "h3", "body", "caption"],
-                        },
+def _thaw(value: Any) -> Any:
+    """Rebuild plain dicts and lists, as JSON encoders and MCP clients expect."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@functools.cache
+def _builtin_component_defs() -> Mapping[ComponentType, ComponentDefinition]:
+    """Built-in component definitions, built once and shared by all registries."""
+    builtins = [
+        ComponentDefinition(
+            component_type=ComponentType.TEXT,
+            name="Text",
+            description="Display text content with optional formatting",
+            schema={
+                "type": "object",
+                "properties": {
+                    "content": {"type": "string"},
+                    "variant": {
+                        "type": "string",
+                        "enum": ["h1", "h2", "h3", "body", "caption"],
                     },
-                    "required": ["content"],
                 },
-                default_props={"variant": "body"},
-            ),
-            ComponentDefinition(
-                component_type=ComponentType.CHART,
-                name="Chart",
-                description="Display data visualizations (line, bar, pie, etc.)",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "chart_type": {
-                            "type": "string",
-                            "enum": ["line", "bar", "pie", "area", "scatter", "donut"],
-                        },
-                        "data": {"type": "array"},
-                        "title": {"type": "string"},
-                        "x_axis": {"type": "string"},
-                        "y_axis": {"type": "string"},
+                "required": ["content"],
+            },
+            default_props={"variant": "body"},
+        ),
+        ComponentDefinition(
+            component_type=ComponentType.CHART,
+            name="Chart",
+            description="Display data visualizations (line, bar, pie, etc.)",
+            schema={
+                "type": "object",
+                "properties": {
+                    "chart_type": {
+                        "type": "string",
+                        "enum": ["line", "bar", "pie", "area", "scatter", "donut"],
                     },
-                    "required": ["chart_type", "data"],
+                    "data": {"type": "array"},
+                    "title": {"type": "string"},
+                    "x_axis": {"type": "string"},
+                    "y_axis": {"type": "string"},
                 },
-                default_props={"chart_type": "line"},
-            ),
-            ComponentDefinition(
-                component_type=ComponentType.TABLE,
-                name="Table",
-                description="Display tabular data with optional sorting/filtering",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "columns": {"type": "array", "items": {"type": "object"}},
-                        "rows": {"type": "array", "items": {"type": "object"}},
-                        "sortable": {"type": "boolean"},
-                        "filterable": {"type": "boolean"},
-                    },
-                    "required": ["columns", "rows"],
+                "required": ["chart_type", "data"],
+            },
+            default_props={"chart_type": "line"},
+        ),
+        ComponentDefinition(
+            component_type=ComponentType.TABLE,
+            name="Table",
+            description="Display tabular data with optional sorting/filtering",
+            schema={
+                "type": "object",
+                "properties": {
+                    "columns": {"type": "array", "items": {"type": "object"}},
+                    "rows": {"type": "array", "items": {"type": "object"}},
+                    "sortable": {"type": "boolean"},
+                    "filterable": {"type": "boolean"},
                 },
-                default_props={"sortable": True, "filterable": False},
-            ),
-            ComponentDefinition(
-                component_type=ComponentType.FORM,
-                name="Form",
-                description="Interactive form with input fields",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "fields": {"type": "array", "items": {"type": "object"}},
-                        "submit_label": {"type": "string"},
-                        "action": {"type": "string"},
-                    },
-                    "required": ["fields"],
+                "required": ["columns", "rows"],
+            },
+            default_props={"sortable": True, "filterable": False},
+        ),
+        ComponentDefinition(
+            component_type=ComponentType.FORM,
+            name="Form",
+            description="Interactive form with input fields",
+            schema={
+                "type": "object",
+                "properties": {
+                    "fields": {"type": "array", "items": {"type": "object"}},
+                    "submit_label": {"type": "string"},
+                    "action": {"type": "string"},
                 },
-                default_props={"submit_label": "Submit"},
-            ),
-            ComponentDefinition(
-                component_type=ComponentType.METRIC,
-                name="Metric",
-                description="Display a single metric/KPI with optional trend",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "label": {"type": "string"},
-                        "value": {"type": ["string", "number"]},
-                        "unit": {"type": "string"},
-                        "trend": {"type": "string", "enum": ["up", "down", "flat"]},
-                        "trend_value": {"type": "string"},
-                    },
-                    "required": ["label", "value"],
+                "required": ["fields"],
+            },
+            default_props={"submit_label": "Submit"},
+        ),
+        ComponentDefinition(
+            component_type=ComponentType.METRIC,
+            name="Metric",
+            description="Display a single metric/KPI with optional trend",
+            schema={
+                "type": "object",
+                "properties": {
+                    "label": {"type": "string"},
+                    "value": {"type": ["string", "number"]},
+                    "unit": {"type": "string"},
+                    "trend": {"type": "string", "enum": ["up", "down", "flat"]},
+                    "trend_value": {"type": "string"},
                 },
-            ),
-            ComponentDefinition(
-                component_type=ComponentType.CARD,
-                name="Card",
-                description="Container card with title and content",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "title": {"type": "string"},
-                        "subtitle": {"type": "string"},
-                        "content": {"type": "string"},
-                    },
+                "required": ["label", "value"],
+            },
+        ),
+        ComponentDefinition(
+            component_type=ComponentType.CARD,
+            name="Card",
+            description="Container card with title and content",
+            schema={
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "subtitle": {"type": "string"},
+                    "content": {"type": "string"},
                 },
-            ),
-            ComponentDefinition(
-                component_type=ComponentType.ALERT,
-                name="Alert",
-                description="Display alert/notification message",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "message": {"type": "string"},
-                        "severity": {
-                            "type": "string",
-                            "enum": ["info", "success", "warning", "error"],
-                        },
-                        "dismissible": {"type": "boolean"},
+            },
+        ),
+        ComponentDefinition(
+            component_type=ComponentType.ALERT,
+            name="Alert",
+            description="Display alert/notification message",
+            schema={
+                "type": "object",
+                "properties": {
+                    "message": {"type": "string"},
+                    "severity": {
+                        "type": "string",
+                        "enum": ["info", "success", "warning", "error"],
                     },
-                    "required": ["message"],
+                    "dismissible": {"type": "boolean"},
                 },
-                default_props={"severity": "info", "dismissible": True},
-            ),
-            ComponentDefinition(
-                component_type=ComponentType.PROGRESS,
-                name="Progress",
-                description="Display progress indicator",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "value": {"type": "number", "minimum": 0, "maximum": 100},
-                        "label": {"type": "string"},
-                        "variant": {"type": "string", "enum": ["linear", "circular"]},
-                    },
-                    "required": ["value"],
+                "required": ["message"],
+            },
+            default_props={"severity": "info", "dismissible": True},
+        ),
+        ComponentDefinition(
+            component_type=ComponentType.PROGRESS,
+            name="Progress",
+            description="Display progress indicator",
+            schema={
+                "type": "object",
+                "properties": {
+                    "value": {"type": "number", "minimum": 0, "maximum": 100},
+                    "label": {"type": "string"},
+                    "variant": {"type": "string", "enum": ["linear", "circular"]},
                 },
-                default_props={"variant": "linear"},
-            ),
-        ]
-        for defn in builtins:
-            self._components[defn.component_type] = defn
+                "required": ["value"],
+            },
+            default_props={"variant": "linear"},
+        ),
+    ]
+    # Shared by every registry, so nested schemas and defaults are frozen
+    return MappingProxyType(
+        {
+            defn.component_type: replace(
+                defn,
+                schema=_freeze(defn.schema),
+                default_props=_freeze(defn.default_props),
+                default_styles=_freeze(defn.default_styles),
+            )
+            for defn in builtins
+        }
+    )
+
+
+class ComponentRegistry:
+    """Registry for UI component definitions.
+
+    Manages available component types and their schemas,
+    allowing agents to discover what UI primitives are available.
+    """
+
+    def __init__(self) -> None:
+        # Per-instance copy so register() can override built-ins locally
+        self._components: dict[ComponentType, ComponentDefinition] = dict(_builtin_component_defs())
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registration, for cache invalidation."""
+        return self._version
 
     def register(self, definition: ComponentDefinition) -> None:
         """Register a component definition."""
         self._components[definition.component_type] = definition
+        self._version += 1
 
     def get(self, component_type: ComponentType) -> ComponentDefinition | None:
         """Get a component definition."""
@@ -206,8 +246,8 @@ class ComponentRegistry:
         merged_styles = {}
 
         if defn:
-            merged_props = {**defn.default_props}
-            merged_styles = {**defn.default_styles}
+            merged_props = _thaw(defn.default_props)
+            merged_styles = dict(defn.default_styles)
 
         if props:
             merged_props.update(props)
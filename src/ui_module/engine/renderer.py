@@ -4,6 +4,7 @@ from typing import Any, Dict
 import yaml
 from jinja2 import Environment, FileSystemLoader
 
+from .config import yaml_loader
 from .models import UIView
 
 
@@ -32,7 +33,7 @@ class Renderer:
         try:
             template = self.jinja_env.get_template(view_path)
             rendered_yaml = template.render(**context)
-            view_dict = yaml.safe_load(rendered_yaml)
+            view_dict = yaml.load(rendered_yaml, Loader=yaml_loader())
 
             return UIView(**view_dict)
         except Exception as e:
@@ -15,9 +15,10 @@ class Router:
         If exact match found in routes config, returns that.
         Otherwise, treats the path as the view ID (stripping leading slash).
         """
-        # 1. Check explicit routes
-        if path in self.routes:
-            return self.routes[path]
+        # 1. Check explicit routes (single lookup)
+        view_id = self.routes.get(path)
+        if view_id is not None:
+            return view_id
 
         # 2. Implicit mapping (e.g. /dashboard -> dashboard)
         clean_path = path.lstrip("/")
@@ -11,6 +11,7 @@ from typing import Any
 
 from .adapters import JsonAdapter, McpUiAdapter
 from .config import ConfigLoader, UISettings
+from .models import COMPONENT_TYPE_NAMES
 from .push_channel import PushChannel
 from .registry import ComponentRegistry
 from .store.view_store import InMemoryViewStore
@@ -30,8 +31,14 @@ class UIRuntime:
     and provides the unified interface for the MCP server.
     """
 
-    def __init__(self, config_dir: str | Path | None = None):
+    def __init__(
+        self,
+        config_dir: str | Path | None = None,
+        store: InMemoryViewStore | None = None,
+    ):
         self.config_loader = ConfigLoader(config_dir)
+        # Built from settings on initialize() unless one is injected
+        self._store = store
         self.settings: UISettings | None = None
         self.view_manager: ViewManager | None = None
         self._initialized = False
@@ -50,14 +57,18 @@ class UIRuntime:
 
             # Initialize components
             registry = ComponentRegistry()
-            store = InMemoryViewStore()
+            store = self._store
+            if store is None:
+                store = InMemoryViewStore(max_history=self.settings.max_history_entries)
             push_channel = PushChannel()
 
-            # Create view manager
+            # Create view manager; component edits return before their push
+            # is delivered, and shutdown() drains any still queued
             self.view_manager = ViewManager(
                 store=store,
                 push_channel=push_channel,
                 registry=registry,
+                push_async=True,
             )
 
             # Register adapters based on settings
@@ -112,13 +123,22 @@ class UIRuntime:
                 if self.settings
                 else 100,
             },
-            "feature_flags": self.settings.feature_flags if self.settings else {},
+            "feature_flags": dict(self.settings.feature_flags) if self.settings else {},
             "component_types": [
-                c.component_type.value
+                COMPONENT_TYPE_NAMES[c.component_type]
                 for c in (self.view_manager.registry.list_components() if self.view_manager else [])
             ],
         }
 
+    def list_adapters(self) -> dict[str, Any]:
+        """List available render adapters and the default."""
+        self._ensure_initialized()
+
+        return {
+            "adapters": self.view_manager.list_adapters() if self.view_manager else [],
+            "default": self.settings.default_adapter if self.settings else "json",
+        }
+
     def health_check(self) -> dict[str, Any]:
         """Check service health.
 
@@ -201,7 +221,7 @@ class UIRuntime:
                         "version": view.version,
                         "component_count": len(view.components),
                         "tags": view.metadata.get("tags", []),
-                        "updated_at": view.updated_at.isoformat(),
+                        "updated_at": view.updated_at_iso,
                     }
                 )
 
@@ -223,6 +243,14 @@ class UIRuntime:
             "schema_version": SCHEMA_VERSION,
         }
 
+    async def shutdown(self) -> None:
+        """Deliver component pushes still queued in the background.
+
+        Call before the event loop stops; the runtime stays usable.
+        """
+        if self.view_manager is not None:
+            await self.view_manager.wait_for_pushes()
+
     def _ensure_initialized(self) -> None:
         """Ensure runtime is initialized."""
         if not self._initialized:
@@ -0,0 +1,59 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is installed (``pip install ui-module[fast]``) and falls
+back to the standard library ``json`` module otherwise. Both paths produce
+the same text: compact separators (or two-space indentation) and raw UTF-8
+rather than ``\\uXXXX`` escapes.
+"""
+
+import json
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from .models import UIComponent, UIView
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the optional extra
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the stdlib encoder does not handle natively."""
+    if isinstance(obj, (UIComponent, UIView)):
+        return obj.to_dict()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Mapping):
+        # e.g. the read-only schemas of built-in component definitions
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Reused across calls; settings match orjson's output format
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+_INDENT_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2, default=_default)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string.
+
+    Args:
+        obj: Value to serialize. May contain ``UIComponent``/``UIView``
+            instances.
+        indent: Pretty-print with two-space indentation.
+    """
+    if orjson is not None:
+        # Dataclasses go through _default so models use their to_dict() shape
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+    if indent:
+        return _INDENT_ENCODER.encode(obj)
+    return _COMPACT_ENCODER.encode(obj)
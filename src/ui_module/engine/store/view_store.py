@@ -1,6 +1,8 @@
 """View store implementations for persisting UI views."""
 
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from ..models import UIView, ViewUpdate
@@ -13,9 +15,12 @@ class InMemoryViewStore:
     use RedisViewStore or implement a persistent store.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_history: int = 1000) -> None:
         self._views: dict[str, UIView] = {}
-        self._history: list[ViewUpdate] = []
+        # Bounded overall log plus per-view indexes into it, so reads never
+        # scan other views; updates leave the index when the log drops them
+        self._history: deque[ViewUpdate] = deque(maxlen=max_history)
+        self._view_history: dict[str, deque[ViewUpdate]] = {}
 
     def get(self, view_id: str) -> UIView | None:
         """Get a view by ID."""
@@ -44,22 +49,47 @@ class InMemoryViewStore:
 
     def record_update(self, update: ViewUpdate) -> None:
         """Record an update in history."""
-        self._history.append(update)
-        # Keep last 1000 updates
-        if len(self._history) > 1000:
-            self._history = self._history[-1000:]
+        history = self._history
+        if len(history) == history.maxlen:
+            if not history:
+                return  # max_history=0 keeps nothing
+            self._forget(history[0])
+        history.append(update)
+
+        view_history = self._view_history.get(update.view_id)
+        if view_history is None:
+            view_history = deque()
+            self._view_history[update.view_id] = view_history
+        view_history.append(update)
+
+    def _forget(self, update: ViewUpdate) -> None:
+        """Drop an update the overall log is about to evict from its view index."""
+        # Each view index mirrors the log, so its oldest entry is this update
+        view_history = self._view_history[update.view_id]
+        view_history.popleft()
+        if not view_history:
+            del self._view_history[update.view_id]
 
     def get_history(self, view_id: str | None = None, limit: int = 100) -> list[ViewUpdate]:
-        """Get update history, optionally filtered by view."""
-        history = self._history
+        """Get the most recent updates, oldest first, optionally filtered by view."""
         if view_id:
-            history = [u for u in history if u.view_id == view_id]
-        return history[-limit:]
+            history = self._view_history.get(view_id)
+            if history is None:
+                return []
+        else:
+            history = self._history
+
+        if limit <= 0 or limit >= len(history):
+            return list(history)
+        recent = list(islice(reversed(history), limit))
+        recent.reverse()
+        return recent
 
     def clear(self) -> None:
         """Clear all views and history."""
         self._views.clear()
         self._history.clear()
+        self._view_history.clear()
 
     def to_dict(self) -> dict[str, Any]:
         """Export store state."""
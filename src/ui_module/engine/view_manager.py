@@ -1,5 +1,7 @@
 """View manager - orchestrates UI operations."""
 
+import asyncio
+import dataclasses
 import uuid
 from datetime import datetime
 from typing import Any
@@ -7,7 +9,7 @@ from typing import Any
 from .adapters.base import RenderAdapter, RenderResult
 from .adapters.json_adapter import JsonAdapter
 from .adapters.mcpui_adapter import McpUiAdapter
-from .models import ComponentType, UIComponent, UIView, ViewUpdate
+from .models import COMPONENT_TYPES_BY_NAME, ComponentType, UIComponent, UIView, ViewUpdate
 from .push_channel import PushChannel
 from .registry import ComponentRegistry
 from .store.view_store import InMemoryViewStore
@@ -28,20 +30,30 @@ class ViewManager:
         store: InMemoryViewStore | None = None,
         push_channel: PushChannel | None = None,
         registry: ComponentRegistry | None = None,
+        push_async: bool = False,
     ) -> None:
         self.store = store or InMemoryViewStore()
         self.push_channel = push_channel or PushChannel()
         self.registry = registry or ComponentRegistry()
 
+        # Component edits push in background tasks, delivered in order
+        self._push_async = push_async
+        self._pending_pushes: set[asyncio.Task[None]] = set()
+        self._last_push: asyncio.Task[None] | None = None
+
         # Default adapters
         self._adapters: dict[str, RenderAdapter] = {
             "json": JsonAdapter(),
             "mcp-ui": McpUiAdapter(),
         }
 
+        # (view_id, adapter_type) -> (view, version, result); saves bump version
+        self._render_cache: dict[tuple[str, str], tuple[UIView, int, RenderResult]] = {}
+
     def register_adapter(self, adapter: RenderAdapter) -> None:
         """Register a render adapter."""
         self._adapters[adapter.adapter_type] = adapter
+        self._render_cache.clear()
 
     def get_adapter(self, adapter_type: str) -> RenderAdapter | None:
         """Get a render adapter by type."""
@@ -76,6 +88,8 @@ class ViewManager:
 
     def delete_view(self, view_id: str) -> bool:
         """Delete a view."""
+        for adapter_type in self._adapters:
+            self._render_cache.pop((view_id, adapter_type), None)
         return self.store.delete(view_id)
 
     def list_views(self) -> list[UIView]:
@@ -93,7 +107,10 @@ class ViewManager:
     ) -> UIComponent:
         """Create a component using the registry."""
         if isinstance(component_type, str):
-            component_type = ComponentType(component_type)
+            # Dict hit for known names; ComponentType() raises the usual error otherwise
+            component_type = COMPONENT_TYPES_BY_NAME.get(component_type) or ComponentType(
+                component_type
+            )
 
         return self.registry.create_component(
             component_id=component_id or str(uuid.uuid4()),
@@ -129,7 +146,38 @@ class ViewManager:
             version=view.version,
         )
         self.store.record_update(update)
-        await self.push_channel.push(update)
+        await self._push(update)
+
+        return view
+
+    async def add_components(
+        self,
+        view_id: str,
+        components: list[UIComponent],
+        position: int | None = None,
+    ) -> UIView | None:
+        """Add several components to a view with a single save and push."""
+        view = self.store.get(view_id)
+        if not view:
+            return None
+
+        if position is not None:
+            view.components[position:position] = components
+        else:
+            view.components.extend(components)
+
+        view.updated_at = datetime.utcnow()
+        self.store.save(view)
+
+        # Push one update for the whole batch
+        update = ViewUpdate(
+            view_id=view_id,
+            action="add_components",
+            payload={"components": [c.to_dict() for c in components], "position": position},
+            version=view.version,
+        )
+        self.store.record_update(update)
+        await self._push(update)
 
         return view
 
@@ -145,14 +193,10 @@ class ViewManager:
         if not view:
             return None
 
-        component = None
-        for c in view.components:
-            if c.id == component_id:
-                component = c
-                break
-
-        if not component:
+        position = view.find_component(component_id)
+        if position is None:
             return None
+        component = view.components[position]
 
         if props:
             component.props.update(props)
@@ -175,7 +219,7 @@ class ViewManager:
             version=view.version,
         )
         self.store.record_update(update)
-        await self.push_channel.push(update)
+        await self._push(update)
 
         return component
 
@@ -189,11 +233,11 @@ class ViewManager:
         if not view:
             return False
 
-        original_len = len(view.components)
-        view.components = [c for c in view.components if c.id != component_id]
-
-        if len(view.components) == original_len:
+        position = view.find_component(component_id)
+        if position is None:
             return False
+        # Delete in place rather than rebuilding the list
+        del view.components[position]
 
         view.updated_at = datetime.utcnow()
         self.store.save(view)
@@ -206,7 +250,7 @@ class ViewManager:
             version=view.version,
         )
         self.store.record_update(update)
-        await self.push_channel.push(update)
+        await self._push(update)
 
         return True
 
@@ -216,6 +260,9 @@ class ViewManager:
         if not view:
             return 0
 
+        # Keep the full state behind any component edits still in flight
+        await self.wait_for_pushes()
+
         update = ViewUpdate(
             view_id=view_id,
             action="full",
@@ -225,6 +272,32 @@ class ViewManager:
         self.store.record_update(update)
         return await self.push_channel.push(update)
 
+    # Push delivery
+
+    async def _push(self, update: ViewUpdate) -> None:
+        """Push an update, in a background task when push_async is set."""
+        if not self._push_async:
+            await self.push_channel.push(update)
+            return
+
+        task = asyncio.create_task(self._push_after(self._last_push, update))
+        self._last_push = task
+        # The event loop only keeps weak references to tasks
+        self._pending_pushes.add(task)
+        task.add_done_callback(self._pending_pushes.discard)
+
+    async def _push_after(self, previous: asyncio.Task[None] | None, update: ViewUpdate) -> None:
+        """Push an update once the previous background push has finished."""
+        if previous is not None and not previous.done():
+            await asyncio.wait((previous,))
+        await self.push_channel.push(update)
+
+    async def wait_for_pushes(self) -> None:
+        """Wait until all background pushes have been delivered."""
+        # Pushes queued while waiting are drained too
+        while self._pending_pushes:
+            await asyncio.wait(tuple(self._pending_pushes))
+
     # Rendering
 
     def render(
@@ -232,7 +305,11 @@ class ViewManager:
         view_id: str,
         adapter_type: str = "json",
     ) -> RenderResult | None:
-        """Render a view using the specified adapter."""
+        """Render a view using the specified adapter.
+
+        Rendered content is reused until the view is saved again; treat it
+        as read-only. Each call gets its own ``rendered_at`` stamp.
+        """
         view = self.store.get(view_id)
         if not view:
             return None
@@ -241,7 +318,14 @@ class ViewManager:
         if not adapter:
             return None
 
-        return adapter.render_view(view)
+        key = (view_id, adapter_type)
+        cached = self._render_cache.get(key)
+        if cached is not None and cached[0] is view and cached[1] == view.version:
+            return dataclasses.replace(cached[2], rendered_at=datetime.utcnow())
+
+        result = adapter.render_view(view)
+        self._render_cache[key] = (view, view.version, result)
+        return result
 
     def render_component(
         self,
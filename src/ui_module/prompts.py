@@ -4,8 +4,13 @@ Prompts provide pre-built templates that guide agents toward
 effective UI creation patterns.
 """
 
+import json
+import re
 from typing import Any
 
+# Matches `{name}` placeholders; unknown names are left as written
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
 
 def get_prompt(prompt_name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
     """Get a prompt by name with arguments filled in."""
@@ -20,15 +25,13 @@ def get_prompt(prompt_name: str, arguments: dict[str, Any] | None = None) -> dic
     prompt = prompts[prompt_name]
     content = prompt["template"]
 
-    # Fill in arguments
+    # Fill in arguments in a single pass over the template
     if arguments:
-        for key, value in arguments.items():
-            placeholder = "{" + key + "}"
-            if isinstance(value, (list, dict)):
-                import json
-
-                value = json.dumps(value, indent=2)
-            content = content.replace(placeholder, str(value))
+        values = {
+            key: json.dumps(value, indent=2) if isinstance(value, (list, dict)) else str(value)
+            for key, value in arguments.items()
+        }
+        content = _PLACEHOLDER.sub(lambda m: values.get(m[1], m[0]), content)
 
     return {
         "name": prompt_name,
@@ -44,29 +47,27 @@ def get_prompt(prompt_name: str, arguments: dict[str, Any] | None = None) -> dic
 
 def list_prompts() -> list[dict[str, Any]]:
     """List all available prompts."""
-    prompts = _get_prompts()
     return [
-        {
-            "name": name,
-            "description": prompt["description"],
-            "arguments": prompt.get("arguments", []),
-        }
-        for name, prompt in prompts.items()
+        {**summary, "arguments": [dict(arg) for arg in summary["arguments"]]}
+        for summary in _PROMPT_SUMMARIES
     ]
 
 
 def _get_prompts() -> dict[str, dict[str, Any]]:
     """Get all prompt definitions."""
-    return {
-        "create_dashboard": {
-            "description": "Create a dashboard with metrics, charts, and tables",
-            "arguments": [
-                {"name": "name", "description": "Dashboard name", "required": True},
-                {"name": "purpose", "description": "What the dashboard is for", "required": True},
-                {"name": "metrics", "description": "List of KPIs to display", "required": False},
-                {"name": "data", "description": "Data to visualize", "required": False},
-            ],
-            "template": """Create a dashboard with the following requirements:
+    return _PROMPTS
+
+
+_PROMPTS: dict[str, dict[str, Any]] = {
+    "create_dashboard": {
+        "description": "Create a dashboard with metrics, charts, and tables",
+        "arguments": [
+            {"name": "name", "description": "Dashboard name", "required": True},
+            {"name": "purpose", "description": "What the dashboard is for", "required": True},
+            {"name": "metrics", "description": "List of KPIs to display", "required": False},
+            {"name": "data", "description": "Data to visualize", "required": False},
+        ],
+        "template": """Create a dashboard with the following requirements:
 
 **Name**: {name}
 **Purpose**: {purpose}
@@ -96,15 +97,15 @@ def _get_prompts() -> dict[str, dict[str, Any]]:
 - Include trends on metrics when comparing periods
 - Use human-readable values ($50K not $50000)
 """,
-        },
-        "add_visualization": {
-            "description": "Add a data visualization to an existing view",
-            "arguments": [
-                {"name": "view_id", "description": "Target view ID", "required": True},
-                {"name": "data", "description": "Data to visualize", "required": True},
-                {"name": "title", "description": "Chart title", "required": False},
-            ],
-            "template": """Add a visualization to view `{view_id}` for this data:
+    },
+    "add_visualization": {
+        "description": "Add a data visualization to an existing view",
+        "arguments": [
+            {"name": "view_id", "description": "Target view ID", "required": True},
+            {"name": "data", "description": "Data to visualize", "required": True},
+            {"name": "title", "description": "Chart title", "required": False},
+        ],
+        "template": """Add a visualization to view `{view_id}` for this data:
 
 ```json
 {data}
@@ -131,14 +132,14 @@ def _get_prompts() -> dict[str, dict[str, Any]]:
 
 4. Consider adding axis labels if the data has clear dimensions
 """,
-        },
-        "design_form": {
-            "description": "Create a form for data collection",
-            "arguments": [
-                {"name": "purpose", "description": "What the form collects", "required": True},
-                {"name": "fields", "description": "Fields to include", "required": True},
-            ],
-            "template": """Create a form for: {purpose}
+    },
+    "design_form": {
+        "description": "Create a form for data collection",
+        "arguments": [
+            {"name": "purpose", "description": "What the form collects", "required": True},
+            {"name": "fields", "description": "Fields to include", "required": True},
+        ],
+        "template": """Create a form for: {purpose}
 
 **Fields needed**:
 {fields}
@@ -167,18 +168,18 @@ def _get_prompts() -> dict[str, dict[str, Any]]:
 
 7. Consider adding an alert component for validation feedback
 """,
-        },
-        "update_metrics": {
-            "description": "Update multiple metrics on a dashboard",
-            "arguments": [
-                {"name": "view_id", "description": "Dashboard view ID", "required": True},
-                {
-                    "name": "updates",
-                    "description": "Metric updates (label → new value)",
-                    "required": True,
-                },
-            ],
-            "template": """Update metrics on dashboard `{view_id}` with new values:
+    },
+    "update_metrics": {
+        "description": "Update multiple metrics on a dashboard",
+        "arguments": [
+            {"name": "view_id", "description": "Dashboard view ID", "required": True},
+            {
+                "name": "updates",
+                "description": "Metric updates (label → new value)",
+                "required": True,
+            },
+        ],
+        "template": """Update metrics on dashboard `{view_id}` with new values:
 
 {updates}
 
@@ -211,14 +212,14 @@ def _get_prompts() -> dict[str, dict[str, Any]]:
 - Use human-readable values
 - Update trends to reflect period-over-period changes
 """,
-        },
-        "create_status_page": {
-            "description": "Create a system status/health page",
-            "arguments": [
-                {"name": "name", "description": "Status page name", "required": True},
-                {"name": "systems", "description": "Systems to monitor", "required": True},
-            ],
-            "template": """Create a status page for monitoring:
+    },
+    "create_status_page": {
+        "description": "Create a system status/health page",
+        "arguments": [
+            {"name": "name", "description": "Status page name", "required": True},
+            {"name": "systems", "description": "Systems to monitor", "required": True},
+        ],
+        "template": """Create a status page for monitoring:
 
 **Name**: {name}
 
@@ -260,5 +261,14 @@ def _get_prompts() -> dict[str, dict[str, Any]]:
 - `warning` (yellow): Degraded performance, attention needed
 - `error` (red): System down or critical issue
 """,
-        },
+    },
+}
+
+_PROMPT_SUMMARIES: tuple[dict[str, Any], ...] = tuple(
+    {
+        "name": name,
+        "description": prompt["description"],
+        "arguments": prompt.get("arguments", []),
     }
+    for name, prompt in _PROMPTS.items()
+)
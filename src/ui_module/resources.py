@@ -4,116 +4,124 @@ Resources provide read-only data that helps agents understand
 what's available and how to use the module effectively.
 """
 
-import json
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
 from typing import Any
+from weakref import WeakKeyDictionary
+
+from .engine.models import COMPONENT_TYPE_NAMES, COMPONENT_TYPES_BY_NAME
+from .engine.serialization import dumps
+
+# Error bodies have a fixed shape, so only the message needs escaping.
+_ERROR_CONTENT = '{{"error": {}}}'
+
+
+@lru_cache(maxsize=256)
+def _error_content(message: str) -> str:
+    """Build the JSON error body for an unknown resource."""
+    return _ERROR_CONTENT.format(encode_basestring_ascii(message))
 
 
 def get_component_schema_resource(component_type: str, registry) -> dict[str, Any]:
     """Get schema resource for a component type."""
-    from .engine.models import ComponentType
-
-    try:
-        comp_type = ComponentType(component_type)
-        definition = registry.get(comp_type)
-        if definition:
-            return {
-                "uri": f"ui://components/{component_type}",
-                "name": f"{definition.name} Component Schema",
-                "description": definition.description,
-                "mimeType": "application/json",
-                "content": json.dumps(
-                    {
-                        "type": component_type,
-                        "name": definition.name,
-                        "description": definition.description,
-                        "schema": definition.schema,
-                        "default_props": definition.default_props,
-                        "default_styles": definition.default_styles,
-                        "example": _get_component_example(component_type),
-                    },
-                    indent=2,
-                ),
-            }
-    except ValueError:
-        pass
+    comp_type = COMPONENT_TYPES_BY_NAME.get(component_type)
+    definition = registry.get(comp_type) if comp_type is not None else None
+    if definition:
+        return {
+            "uri": f"ui://components/{component_type}",
+            "name": f"{definition.name} Component Schema",
+            "description": definition.description,
+            "mimeType": "application/json",
+            "content": _component_schema_content(component_type, definition, registry),
+        }
 
     return {
         "uri": f"ui://components/{component_type}",
         "name": f"Unknown Component: {component_type}",
         "mimeType": "application/json",
-        "content": json.dumps({"error": f"Unknown component type: {component_type}"}),
+        "content": _error_content(f"Unknown component type: {component_type}"),
     }
 
 
+def _component_schema_content(component_type: str, definition, registry) -> str:
+    """Serialize one component schema, reused until the registry changes."""
+    cached = _component_schema_cache.get(registry)
+    if cached is None or cached[0] != registry.version:
+        cached = (registry.version, {})
+        _component_schema_cache[registry] = cached
+    content = cached[1].get(component_type)
+    if content is None:
+        content = dumps(
+            {
+                "type": component_type,
+                "name": definition.name,
+                "description": definition.description,
+                "schema": definition.schema,
+                "default_props": definition.default_props,
+                "default_styles": definition.default_styles,
+                "example": _get_component_example(component_type),
+            },
+            indent=True,
+        )
+        cached[1][component_type] = content
+    return content
+
+
 def get_all_components_resource(registry) -> dict[str, Any]:
     """Get resource listing all available components."""
-    components = []
-    for defn in registry.list_components():
-        components.append(
+    cached = _all_components_cache.get(registry)
+    if cached is not None and cached[0] == registry.version:
+        content = cached[1]
+    else:
+        components = [
             {
-                "type": defn.component_type.value,
+                "type": COMPONENT_TYPE_NAMES[defn.component_type],
                 "name": defn.name,
                 "description": defn.description,
                 "schema": defn.schema,
             }
-        )
+            for defn in registry.list_components()
+        ]
+        content = dumps({"components": components, "total": len(components)}, indent=True)
+        _all_components_cache[registry] = (registry.version, content)
 
     return {
         "uri": "ui://components",
         "name": "All UI Components",
         "description": "Complete list of available UI component types with their schemas",
         "mimeType": "application/json",
-        "content": json.dumps(
-            {
-                "components": components,
-                "total": len(components),
-            },
-            indent=2,
-        ),
+        "content": content,
     }
 
 
 def get_template_resource(template_name: str) -> dict[str, Any]:
     """Get a view template resource."""
-    templates = _get_templates()
-
-    if template_name in templates:
-        template = templates[template_name]
+    if template_name in _TEMPLATES:
+        template = _TEMPLATES[template_name]
         return {
             "uri": f"ui://templates/{template_name}",
             "name": template["name"],
             "description": template["description"],
             "mimeType": "application/json",
-            "content": json.dumps(template, indent=2),
+            "content": _TEMPLATE_CONTENT[template_name],
         }
 
     return {
         "uri": f"ui://templates/{template_name}",
         "name": f"Unknown Template: {template_name}",
         "mimeType": "application/json",
-        "content": json.dumps({"error": f"Unknown template: {template_name}"}),
+        "content": _error_content(f"Unknown template: {template_name}"),
     }
 
 
 def get_all_templates_resource() -> dict[str, Any]:
     """Get resource listing all available templates."""
-    templates = _get_templates()
-
     return {
         "uri": "ui://templates",
         "name": "View Templates",
         "description": "Pre-built view templates for common UI patterns",
         "mimeType": "application/json",
-        "content": json.dumps(
-            {
-                "templates": list(templates.keys()),
-                "details": {
-                    k: {"name": v["name"], "description": v["description"]}
-                    for k, v in templates.items()
-                },
-            },
-            indent=2,
-        ),
+        "content": _ALL_TEMPLATES_CONTENT,
     }
 
 
@@ -127,30 +135,22 @@ def get_view_resource(view_id: str, view_manager) -> dict[str, Any]:
             "name": view.name,
             "description": f"View: {view.name} (v{view.version})",
             "mimeType": "application/json",
-            "content": json.dumps(view.to_dict(), indent=2),
+            "content": dumps(view.to_dict(), indent=True),
         }
 
     return {
         "uri": f"ui://views/{view_id}",
         "name": f"Unknown View: {view_id}",
         "mimeType": "application/json",
-        "content": json.dumps({"error": f"View not found: {view_id}"}),
+        "content": _error_content(f"View not found: {view_id}"),
     }
 
 
 def get_docs_resource(doc_name: str) -> dict[str, Any]:
     """Get documentation resource."""
-    docs = _get_docs()
-
-    if doc_name in docs:
-        doc = docs[doc_name]
-        return {
-            "uri": f"ui://docs/{doc_name}",
-            "name": doc["name"],
-            "description": doc["description"],
-            "mimeType": "text/markdown",
-            "content": doc["content"],
-        }
+    resource = _DOC_RESOURCES.get(doc_name)
+    if resource is not None:
+        return dict(resource)
 
     return {
         "uri": f"ui://docs/{doc_name}",
@@ -161,48 +161,18 @@ def get_docs_resource(doc_name: str) -> dict[str, Any]:
 
 
 def list_all_resources(registry, view_manager) -> list[dict[str, Any]]:
-    """List all available resources."""
-    resources = []
+    """List all available resources.
 
-    # Component schemas
-    resources.append(
-        {
-            "uri": "ui://components",
-            "name": "All UI Components",
-            "description": "Complete list of available UI component types",
-            "mimeType": "application/json",
-        }
-    )
+    Static entries are built once; each call gets its own copies of them.
+    """
+    resources = [dict(_COMPONENTS_LIST_ENTRY)]
 
-    for defn in registry.list_components():
-        resources.append(
-            {
-                "uri": f"ui://components/{defn.component_type.value}",
-                "name": f"{defn.name} Schema",
-                "description": defn.description,
-                "mimeType": "application/json",
-            }
-        )
+    # Component schemas
+    resources.extend(map(dict, _component_list_entries(registry)))
 
     # Templates
-    resources.append(
-        {
-            "uri": "ui://templates",
-            "name": "View Templates",
-            "description": "Pre-built view templates",
-            "mimeType": "application/json",
-        }
-    )
-
-    for name, template in _get_templates().items():
-        resources.append(
-            {
-                "uri": f"ui://templates/{name}",
-                "name": template["name"],
-                "description": template["description"],
-                "mimeType": "application/json",
-            }
-        )
+    resources.append(dict(_TEMPLATES_LIST_ENTRY))
+    resources.extend(map(dict, _TEMPLATE_LIST_ENTRIES))
 
     # Current views
     for view in view_manager.list_views():
@@ -216,27 +186,62 @@ def list_all_resources(registry, view_manager) -> list[dict[str, Any]]:
         )
 
     # Documentation
-    for name, doc in _get_docs().items():
-        resources.append(
-            {
-                "uri": f"ui://docs/{name}",
-                "name": doc["name"],
-                "description": doc["description"],
-                "mimeType": "text/markdown",
-            }
-        )
+    resources.extend(map(dict, _DOC_LIST_ENTRIES))
 
     # External resources
-    resources.append(
+    resources.append(dict(_MCPUI_DOCS_LIST_ENTRY))
+
+    return resources
+
+
+_COMPONENTS_LIST_ENTRY: dict[str, Any] = {
+    "uri": "ui://components",
+    "name": "All UI Components",
+    "description": "Complete list of available UI component types",
+    "mimeType": "application/json",
+}
+
+_TEMPLATES_LIST_ENTRY: dict[str, Any] = {
+    "uri": "ui://templates",
+    "name": "View Templates",
+    "description": "Pre-built view templates",
+    "mimeType": "application/json",
+}
+
+_MCPUI_DOCS_LIST_ENTRY: dict[str, Any] = {
+    "uri": "https://mcpui.dev/guide/introduction",
+    "name": "MCP-UI Documentation",
+    "description": "Official MCP-UI protocol documentation",
+    "mimeType": "text/html",
+}
+
+# registry -> (registry.version, content); built-ins rarely change, so these hit
+_all_components_cache: WeakKeyDictionary[Any, tuple[int, str]] = WeakKeyDictionary()
+_component_schema_cache: WeakKeyDictionary[Any, tuple[int, dict[str, str]]] = WeakKeyDictionary()
+
+# registry -> (registry.version, entries)
+_component_entries_cache: WeakKeyDictionary[Any, tuple[int, tuple[dict[str, Any], ...]]] = (
+    WeakKeyDictionary()
+)
+
+
+def _component_list_entries(registry) -> tuple[dict[str, Any], ...]:
+    """Get listing entries for registered components, cached per registry version."""
+    cached = _component_entries_cache.get(registry)
+    if cached is not None and cached[0] == registry.version:
+        return cached[1]
+
+    entries = tuple(
         {
-            "uri": "https://mcpui.dev/guide/introduction",
-            "name": "MCP-UI Documentation",
-            "description": "Official MCP-UI protocol documentation",
-            "mimeType": "text/html",
+            "uri": f"ui://components/{COMPONENT_TYPE_NAMES[defn.component_type]}",
+            "name": f"{defn.name} Schema",
+            "description": defn.description,
+            "mimeType": "application/json",
         }
+        for defn in registry.list_components()
     )
-
-    return resources
+    _component_entries_cache[registry] = (registry.version, entries)
+    return entries
 
 
 def _get_component_example(component_type: str) -> dict[str, Any]:
@@ -295,70 +300,95 @@ def _get_component_example(component_type: str) -> dict[str, Any]:
     return examples.get(component_type, {"props": {}, "description": "No example available"})
 
 
-def _get_templates() -> dict[str, dict[str, Any]]:
-    """Get pre-built view templates."""
-    return {
-        "dashboard": {
-            "name": "Dashboard Template",
-            "description": "A standard dashboard with metrics, charts, and tables",
-            "layout": {"type": "grid", "columns": 3},
-            "suggested_components": [
-                {"type": "metric", "count": "3-6", "purpose": "KPIs at the top"},
-                {"type": "chart", "count": "1-3", "purpose": "Data visualizations"},
-                {"type": "table", "count": "0-2", "purpose": "Detailed data"},
-            ],
-            "example": {
-                "name": "Sales Dashboard",
-                "metrics": [
-                    {"label": "Revenue", "value": "$50K"},
-                    {"label": "Orders", "value": "1,234"},
-                    {"label": "Customers", "value": "567"},
-                ],
-                "charts": [{"title": "Monthly Trend", "chart_type": "line"}],
-            },
-        },
-        "report": {
-            "name": "Report Template",
-            "description": "A report layout with title, summary, and detailed sections",
-            "layout": {"type": "flex", "direction": "column"},
-            "suggested_components": [
-                {"type": "text", "variant": "h1", "purpose": "Report title"},
-                {"type": "text", "variant": "body", "purpose": "Executive summary"},
-                {"type": "chart", "count": "1-2", "purpose": "Key visualizations"},
-                {"type": "table", "count": "1-3", "purpose": "Detailed data tables"},
+# Pre-built view templates
+_TEMPLATES: dict[str, dict[str, Any]] = {
+    "dashboard": {
+        "name": "Dashboard Template",
+        "description": "A standard dashboard with metrics, charts, and tables",
+        "layout": {"type": "grid", "columns": 3},
+        "suggested_components": [
+            {"type": "metric", "count": "3-6", "purpose": "KPIs at the top"},
+            {"type": "chart", "count": "1-3", "purpose": "Data visualizations"},
+            {"type": "table", "count": "0-2", "purpose": "Detailed data"},
+        ],
+        "example": {
+            "name": "Sales Dashboard",
+            "metrics": [
+                {"label": "Revenue", "value": "$50K"},
+                {"label": "Orders", "value": "1,234"},
+                {"label": "Customers", "value": "567"},
             ],
+            "charts": [{"title": "Monthly Trend", "chart_type": "line"}],
         },
-        "form": {
-            "name": "Form Template",
-            "description": "A form layout for data collection",
-            "layout": {"type": "flex", "direction": "column"},
-            "suggested_components": [
-                {"type": "text", "variant": "h2", "purpose": "Form title"},
-                {"type": "form", "count": 1, "purpose": "Input fields"},
-                {"type": "alert", "purpose": "Validation messages"},
-            ],
-        },
-        "status": {
-            "name": "Status Page Template",
-            "description": "A status/health page showing system state",
-            "layout": {"type": "grid", "columns": 2},
-            "suggested_components": [
-                {"type": "text", "variant": "h1", "purpose": "Page title"},
-                {"type": "alert", "count": "1-3", "purpose": "Status indicators"},
-                {"type": "metric", "count": "2-6", "purpose": "Health metrics"},
-                {"type": "progress", "count": "0-4", "purpose": "Resource usage"},
-            ],
+    },
+    "report": {
+        "name": "Report Template",
+        "description": "A report layout with title, summary, and detailed sections",
+        "layout": {"type": "flex", "direction": "column"},
+        "suggested_components": [
+            {"type": "text", "variant": "h1", "purpose": "Report title"},
+            {"type": "text", "variant": "body", "purpose": "Executive summary"},
+            {"type": "chart", "count": "1-2", "purpose": "Key visualizations"},
+            {"type": "table", "count": "1-3", "purpose": "Detailed data tables"},
+        ],
+    },
+    "form": {
+        "name": "Form Template",
+        "description": "A form layout for data collection",
+        "layout": {"type": "flex", "direction": "column"},
+        "suggested_components": [
+            {"type": "text", "variant": "h2", "purpose": "Form title"},
+            {"type": "form", "count": 1, "purpose": "Input fields"},
+            {"type": "alert", "purpose": "Validation messages"},
+        ],
+    },
+    "status": {
+        "name": "Status Page Template",
+        "description": "A status/health page showing system state",
+        "layout": {"type": "grid", "columns": 2},
+        "suggested_components": [
+            {"type": "text", "variant": "h1", "purpose": "Page title"},
+            {"type": "alert", "count": "1-3", "purpose": "Status indicators"},
+            {"type": "metric", "count": "2-6", "purpose": "Health metrics"},
+            {"type": "progress", "count": "0-4", "purpose": "Resource usage"},
+        ],
+    },
+}
+
+# Templates are static, so their JSON bodies are serialized once at import and
+# passed through verbatim wherever they are served or embedded.
+_TEMPLATE_CONTENT: dict[str, str] = {
+    name: dumps(template, indent=True) for name, template in _TEMPLATES.items()
+}
+
+_ALL_TEMPLATES_CONTENT = dumps(
+    {
+        "templates": list(_TEMPLATES),
+        "details": {
+            k: {"name": v["name"], "description": v["description"]} for k, v in _TEMPLATES.items()
         },
+    },
+    indent=True,
+)
+
+# Listing entries are copied by list_all_resources before they are handed out
+_TEMPLATE_LIST_ENTRIES: tuple[dict[str, Any], ...] = tuple(
+    {
+        "uri": f"ui://templates/{name}",
+        "name": template["name"],
+        "description": template["description"],
+        "mimeType": "application/json",
     }
+    for name, template in _TEMPLATES.items()
+)
 
 
-def _get_docs() -> dict[str, dict[str, Any]]:
-    """Get documentation content."""
-    return {
-        "getting-started": {
-            "name": "Getting Started",
-            "description": "Quick start guide for using the UI module",
-            "content": """# Getting Started with UI Module
+# Built-in documentation
+_DOCS: dict[str, dict[str, Any]] = {
+    "getting-started": {
+        "name": "Getting Started",
+        "description": "Quick start guide for using the UI module",
+        "content": """# Getting Started with UI Module
 
 ## Overview
 
@@ -388,11 +418,11 @@ Instead of writing code, you describe what you want and the agent builds it.
 - Use `ui://templates/dashboard` for dashboard patterns
 - Always provide meaningful labels and titles
 """,
-        },
-        "component-guide": {
-            "name": "Component Guide",
-            "description": "Detailed guide for each component type",
-            "content": """# Component Guide
+    },
+    "component-guide": {
+        "name": "Component Guide",
+        "description": "Detailed guide for each component type",
+        "content": """# Component Guide
 
 ## Metric Component
 
@@ -458,11 +488,11 @@ Best for: Detailed data, lists, records
 | Progress/loading | progress |
 | User input | form |
 """,
-        },
-        "best-practices": {
-            "name": "Best Practices",
-            "description": "UI design patterns and recommendations",
-            "content": """# UI Best Practices
+    },
+    "best-practices": {
+        "name": "Best Practices",
+        "description": "UI design patterns and recommendations",
+        "content": """# UI Best Practices
 
 ## Dashboard Design
 
@@ -511,5 +541,21 @@ Best for: Detailed data, lists, records
 - Don't rely on color alone for meaning
 - Provide text alternatives for charts
 """,
-        },
+    },
+}
+
+_DOC_LIST_ENTRIES: tuple[dict[str, Any], ...] = tuple(
+    {
+        "uri": f"ui://docs/{name}",
+        "name": doc["name"],
+        "description": doc["description"],
+        "mimeType": "text/markdown",
     }
+    for name, doc in _DOCS.items()
+)
+
+# Full resource bodies, built once; get_docs_resource hands out copies
+_DOC_RESOURCES: dict[str, dict[str, Any]] = {
+    name: {**entry, "content": _DOCS[name]["content"]}
+    for name, entry in zip(_DOCS, _DOC_LIST_ENTRIES, strict=True)
+}
@@ -8,8 +8,13 @@ Provides tools, resources, and prompts for agent-driven UI manipulation:
 - Prompts (guided UI creation patterns)
 """
 
+import contextlib
+import functools
+import inspect
 import logging
 import os
+import uuid
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
@@ -17,23 +22,113 @@ from mcp.server.fastmcp import FastMCP
 from . import prompts as prm
 from . import resources as res
 from .engine.envelope import ContextEnvelope
-from .engine.models import ComponentType
-from .engine.runtime import UIRuntime, get_runtime
+from .engine.models import COMPONENT_TYPES_BY_NAME, ComponentType, UIView
+from .engine.runtime import UIRuntime, get_runtime, reset_runtime
+from .engine.serialization import dumps
+from .engine.view_manager import ViewManager
 
 logger = logging.getLogger(__name__)
 
+
+@contextlib.asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Deliver queued component pushes before the server stops."""
+    try:
+        yield
+    finally:
+        if _RUNTIME is not None:
+            await _RUNTIME.shutdown()
+
+
 # Initialize MCP server
-mcp = FastMCP("ui-module")
+mcp = FastMCP("ui-module", lifespan=_lifespan)
+
+# Resolved once on first use so tool dispatch is a single global load
+_RUNTIME: UIRuntime | None = None
+_VIEW_MANAGER: ViewManager | None = None
+
+# Read from the environment at import; settings are OR'd in once the runtime loads
+_AUTHORING_ENV = os.environ.get("AUTHORING_ENABLED", "").lower() == "true"
+_AUTHORING_ENABLED = _AUTHORING_ENV
 
 
 def _get_runtime() -> UIRuntime:
     """Get the runtime instance."""
-    config_dir = os.environ.get("UI_CONFIG_DIR")
-    return get_runtime(config_dir)
+    global _RUNTIME, _VIEW_MANAGER
+    runtime = _RUNTIME
+    if runtime is None:
+        _RUNTIME = runtime = get_runtime(os.environ.get("UI_CONFIG_DIR"))
+        _VIEW_MANAGER = runtime.view_manager
+        _update_authoring_flag(runtime)
+    return runtime
+
+
+def _update_authoring_flag(runtime: UIRuntime | None) -> None:
+    """Combine the environment flag with the runtime's settings."""
+    global _AUTHORING_ENABLED
+    _AUTHORING_ENABLED = _AUTHORING_ENV or bool(
+        runtime and runtime.settings and runtime.settings.authoring_enabled
+    )
+
+
+def _refresh_authoring_flag() -> None:
+    """Re-read AUTHORING_ENABLED from the environment (for testing)."""
+    global _AUTHORING_ENV
+    _AUTHORING_ENV = os.environ.get("AUTHORING_ENABLED", "").lower() == "true"
+    _update_authoring_flag(_RUNTIME)
+
+
+def _get_view_manager() -> ViewManager | None:
+    """Get the runtime's view manager, bound on first runtime resolution."""
+    view_manager = _VIEW_MANAGER
+    if view_manager is None:
+        view_manager = _get_runtime().view_manager
+    return view_manager
+
+
+def _reset_runtime() -> None:
+    """Reset cached runtime state (for testing)."""
+    global _RUNTIME, _VIEW_MANAGER
+    _RUNTIME = None
+    _VIEW_MANAGER = None
+    _refresh_authoring_flag()
+    _VIEW_RESOURCE_CACHE.clear()
+    reset_runtime()
+
+
+class _DefaultEnvelope:
+    """Stand-in for an omitted envelope.
+
+    Tools only read ``request_id`` from it, so the full ContextEnvelope
+    (timestamp, validation) is skipped and the ID is generated on first read.
+    """
+
+    __slots__ = ("_request_id",)
+
+    def __init__(self) -> None:
+        self._request_id: str | None = None
 
+    @property
+    def request_id(self) -> str:
+        request_id = self._request_id
+        if request_id is None:
+            self._request_id = request_id = str(uuid.uuid4())
+        return request_id
 
-def _parse_envelope(envelope: dict[str, Any] | None) -> ContextEnvelope:
+
+_NOT_INITIALIZED_ERR = "Runtime not initialized"
+_NOT_INITIALIZED_CONTENT = dumps({"error": _NOT_INITIALIZED_ERR})
+
+
+def _not_initialized(ctx: ContextEnvelope | _DefaultEnvelope) -> dict[str, Any]:
+    """Build the error returned by tools when the runtime has no view manager."""
+    return {"error": _NOT_INITIALIZED_ERR, "request_id": ctx.request_id}
+
+
+def _parse_envelope(envelope: dict[str, Any] | None) -> ContextEnvelope | _DefaultEnvelope:
     """Parse context envelope from tool input."""
+    if not envelope:
+        return _DefaultEnvelope()
     return ContextEnvelope.from_dict(envelope)
 
 
@@ -42,29 +137,32 @@ def _parse_envelope(envelope: dict[str, Any] | None) -> ContextEnvelope:
 # ============================================================================
 
 
+# Serialized resource bodies, keyed by URI plus the state they were built from
+_VIEW_RESOURCE_CACHE: dict[str, tuple[UIView, int, str]] = {}
+
+
 @mcp.resource("ui://components")
 def resource_all_components() -> str:
     """List all available UI component types with their schemas."""
-    runtime = _get_runtime()
-    assert runtime.view_manager is not None
-    result = res.get_all_components_resource(runtime.view_manager.registry)
-    return result["content"]
+    view_manager = _get_view_manager()
+    if view_manager is None:
+        return _NOT_INITIALIZED_CONTENT
+    return res.get_all_components_resource(view_manager.registry)["content"]
 
 
 @mcp.resource("ui://components/{component_type}")
 def resource_component_schema(component_type: str) -> str:
     """Get the JSON schema for a specific component type."""
-    runtime = _get_runtime()
-    assert runtime.view_manager is not None
-    result = res.get_component_schema_resource(component_type, runtime.view_manager.registry)
-    return result["content"]
+    view_manager = _get_view_manager()
+    if view_manager is None:
+        return _NOT_INITIALIZED_CONTENT
+    return res.get_component_schema_resource(component_type, view_manager.registry)["content"]
 
 
 @mcp.resource("ui://templates")
 def resource_all_templates() -> str:
     """List all available view templates."""
-    result = res.get_all_templates_resource()
-    return result["content"]
+    return res.get_all_templates_resource()["content"]
 
 
 @mcp.resource("ui://templates/{template_name}")
@@ -77,9 +175,29 @@ def resource_template(template_name: str) -> str:
 @mcp.resource("ui://views/{view_id}")
 def resource_view(view_id: str) -> str:
     """Get a specific view's current state."""
-    runtime = _get_runtime()
-    result = res.get_view_resource(view_id, runtime.view_manager)
-    return result["content"]
+    view_manager = _get_view_manager()
+    view = view_manager.get_view(view_id) if view_manager else None
+    if view is None:
+        _VIEW_RESOURCE_CACHE.pop(view_id, None)
+        return res.get_view_resource(view_id, view_manager)["content"]
+
+    # Reused until the view is replaced or edited (every edit bumps version)
+    cached = _VIEW_RESOURCE_CACHE.get(view_id)
+    if cached is not None and cached[0] is view and cached[1] == view.version:
+        return cached[2]
+    content = res.get_view_resource(view_id, view_manager)["content"]
+    _VIEW_RESOURCE_CACHE[view_id] = (view, view.version, content)
+    return content
+
+
+@mcp.resource("ui://views/{view_id}/since/{version}")
+def resource_view_since(view_id: str, version: str) -> str:
+    """Get a view's state unless the caller already holds this version."""
+    view_manager = _get_view_manager()
+    view = view_manager.get_view(view_id) if view_manager else None
+    if view is not None and str(view.version) == version:
+        return dumps({"not_modified": True, "view_id": view_id, "version": view.version})
+    return resource_view(view_id)
 
 
 @mcp.resource("ui://docs/{doc_name}")
@@ -256,9 +374,9 @@ def ui_get_component_registry() -> dict[str, Any]:
 
     This is a deterministic tool - safe to call anytime.
     """
-    runtime = _get_runtime()
-    if runtime.view_manager:
-        return runtime.view_manager.registry.to_dict()
+    view_manager = _get_view_manager()
+    if view_manager:
+        return view_manager.registry.to_dict()
     return {"components": []}
 
 
@@ -271,12 +389,7 @@ def ui_list_adapters() -> dict[str, Any]:
     This is a deterministic tool - safe to call anytime.
     """
     runtime = _get_runtime()
-    if runtime.view_manager:
-        return {
-            "adapters": runtime.view_manager.list_adapters(),
-            "default": runtime.settings.default_adapter if runtime.settings else "json",
-        }
-    return {"adapters": [], "default": "json"}
+    return runtime.list_adapters()
 
 
 @mcp.tool()
@@ -286,9 +399,10 @@ def ui_list_resources() -> dict[str, Any]:
     Returns URIs for component schemas, templates, views, and documentation
     that agents can read for context.
     """
-    runtime = _get_runtime()
-    assert runtime.view_manager is not None
-    resources = res.list_all_resources(runtime.view_manager.registry, runtime.view_manager)
+    view_manager = _get_view_manager()
+    if view_manager is None:
+        return {"resources": [], "total": 0}
+    resources = res.list_all_resources(view_manager.registry, view_manager)
     return {
         "resources": resources,
         "total": len(resources),
@@ -302,10 +416,7 @@ def ui_list_prompts() -> dict[str, Any]:
     Returns prompt names and descriptions for guided UI creation.
     """
     prompts = prm.list_prompts()
-    return {
-        "prompts": prompts,
-        "total": len(prompts),
-    }
+    return {"prompts": prompts, "total": len(prompts)}
 
 
 # ============================================================================
@@ -314,6 +425,17 @@ def ui_list_prompts() -> dict[str, Any]:
 # ============================================================================
 
 
+def _view_summary(view: UIView) -> dict[str, Any]:
+    """Summarize a view for listings."""
+    return {
+        "id": view.id,
+        "name": view.name,
+        "component_count": len(view.components),
+        "version": view.version,
+        "updated_at": view.updated_at_iso,
+    }
+
+
 @mcp.tool()
 def ui_list_views(envelope: dict[str, Any] | None = None) -> dict[str, Any]:
     """List all available views.
@@ -324,23 +446,13 @@ def ui_list_views(envelope: dict[str, Any] | None = None) -> dict[str, Any]:
     Returns a list of all views with their IDs, names, and component counts.
     """
     ctx = _parse_envelope(envelope)
-    runtime = _get_runtime()
-
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    views = runtime.view_manager.list_views()
+    views = vm.list_views()
     return {
-        "views": [
-            {
-                "id": v.id,
-                "name": v.name,
-                "component_count": len(v.components),
-                "version": v.version,
-                "updated_at": v.updated_at.isoformat(),
-            }
-            for v in views
-        ],
+        "views": list(map(_view_summary, views)),
         "total": len(views),
         "request_id": ctx.request_id,
     }
@@ -350,6 +462,7 @@ def ui_list_views(envelope: dict[str, Any] | None = None) -> dict[str, Any]:
 def ui_get_view(
     view_id: str,
     adapter: str = "json",
+    return_handle: bool = False,
     envelope: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Get a view by ID, optionally rendered through an adapter.
@@ -357,25 +470,39 @@ def ui_get_view(
     Args:
         view_id: The view ID to retrieve
         adapter: Render adapter to use ("json" or "mcp-ui")
+        return_handle: Return only the view's version and resource URI
+            instead of its rendered content
         envelope: Optional context envelope for correlation/audit
 
-    Returns the view data rendered through the specified adapter.
+    Returns the view data rendered through the specified adapter. With
+    return_handle, read ``uri`` for the content, or ``since_uri`` to get a
+    ``not_modified`` marker while the view is still at that version.
     """
     ctx = _parse_envelope(envelope)
-    runtime = _get_runtime()
-
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
+
+    if return_handle:
+        view = vm.get_view(view_id)
+        if not view:
+            return {"error": f"View not found: {view_id}", "request_id": ctx.request_id}
+        return {
+            "view_id": view_id,
+            "version": view.version,
+            "uri": f"ui://views/{view_id}",
+            "since_uri": f"ui://views/{view_id}/since/{view.version}",
+            "request_id": ctx.request_id,
+        }
 
-    result = runtime.view_manager.render(view_id, adapter_type=adapter)
+    result = vm.render(view_id, adapter_type=adapter)
 
     if not result:
         return {"error": f"View not found: {view_id}", "request_id": ctx.request_id}
 
-    return {
-        **result.to_dict(),
-        "request_id": ctx.request_id,
-    }
+    payload = result.to_dict()
+    payload["request_id"] = ctx.request_id
+    return payload
 
 
 @mcp.tool()
@@ -388,13 +515,12 @@ def ui_get_push_channel_status(envelope: dict[str, Any] | None = None) -> dict[s
     Shows connected clients and their subscriptions.
     """
     ctx = _parse_envelope(envelope)
-    runtime = _get_runtime()
-
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
     return {
-        **runtime.view_manager.push_channel.to_dict(),
+        **vm.push_channel.to_dict(),
         "request_id": ctx.request_id,
     }
 
@@ -415,12 +541,11 @@ def ui_get_view_history(
     Returns recent updates pushed to clients.
     """
     ctx = _parse_envelope(envelope)
-    runtime = _get_runtime()
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
-
-    history = runtime.view_manager.store.get_history(view_id=view_id, limit=limit)
+    history = vm.store.get_history(view_id=view_id, limit=limit)
     return {
         "updates": [u.to_dict() for u in history],
         "count": len(history),
@@ -444,15 +569,14 @@ def ui_connect_client(
     Returns connection details.
     """
     ctx = _parse_envelope(envelope)
-    runtime = _get_runtime()
-
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    connection = runtime.view_manager.push_channel.connect(client_id)
+    connection = vm.push_channel.connect(client_id)
 
     for view_id in subscribe_to or []:
-        runtime.view_manager.push_channel.subscribe(client_id, view_id)
+        vm.push_channel.subscribe(client_id, view_id)
 
     return {
         "connected": True,
@@ -474,12 +598,11 @@ def ui_disconnect_client(
         envelope: Optional context envelope for correlation/audit
     """
     ctx = _parse_envelope(envelope)
-    runtime = _get_runtime()
-
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    disconnected = runtime.view_manager.push_channel.disconnect(client_id)
+    disconnected = vm.push_channel.disconnect(client_id)
     return {
         "disconnected": disconnected,
         "client_id": client_id,
@@ -501,12 +624,11 @@ def ui_subscribe(
         envelope: Optional context envelope for correlation/audit
     """
     ctx = _parse_envelope(envelope)
-    runtime = _get_runtime()
-
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    subscribed = runtime.view_manager.push_channel.subscribe(client_id, view_id)
+    subscribed = vm.push_channel.subscribe(client_id, view_id)
     return {
         "subscribed": subscribed,
         "client_id": client_id,
@@ -520,15 +642,44 @@ def ui_subscribe(
 # Require AUTHORING_ENABLED=true or settings.authoring_enabled=true
 # ============================================================================
 
+_AUTHORING_DISABLED_ERR = "Authoring tools are disabled. Set AUTHORING_ENABLED=true"
+
 
 def _is_authoring_enabled() -> bool:
     """Check if authoring tools are enabled."""
-    if os.environ.get("AUTHORING_ENABLED", "").lower() == "true":
-        return True
-    runtime = _get_runtime()
-    if runtime.settings and runtime.settings.authoring_enabled:
-        return True
-    return False
+    if _RUNTIME is None:
+        # Settings can only enable authoring once the runtime has loaded them
+        _get_runtime()
+    return _AUTHORING_ENABLED
+
+
+def _authoring_disabled(envelope: dict[str, Any] | None) -> dict[str, Any]:
+    """Build the error returned by authoring tools while authoring is off."""
+    return {"error": _AUTHORING_DISABLED_ERR, "request_id": _parse_envelope(envelope).request_id}
+
+
+def _requires_authoring(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Return the authoring-disabled error instead of calling ``fn``.
+
+    The tool's own ``envelope`` keyword argument supplies the request_id.
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _is_authoring_enabled():
+                return _authoring_disabled(kwargs.get("envelope"))
+            return await fn(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _is_authoring_enabled():
+            return _authoring_disabled(kwargs.get("envelope"))
+        return fn(*args, **kwargs)
+
+    return wrapper
 
 
 @mcp.tool()
@@ -543,6 +694,7 @@ def ui_authoring_get_status() -> dict[str, Any]:
 
 
 @mcp.tool()
+@_requires_authoring
 def ui_create_view(
     name: str,
     view_id: str | None = None,
@@ -562,45 +714,34 @@ def ui_create_view(
     Returns the created view. Requires AUTHORING_ENABLED=true.
     """
     ctx = _parse_envelope(envelope)
-
-    if not _is_authoring_enabled():
-        return {
-            "error": "Authoring tools are disabled. Set AUTHORING_ENABLED=true",
-            "request_id": ctx.request_id,
-        }
-
-    runtime = _get_runtime()
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
     layout = {"type": layout_type}
     if layout_type == "grid":
         layout["columns"] = layout_columns  # type: ignore[assignment]
 
-    view = runtime.view_manager.create_view(name=name, view_id=view_id, layout=layout)
+    view = vm.create_view(name=name, view_id=view_id, layout=layout)
     return {"created": True, "view": view.to_dict(), "request_id": ctx.request_id}
 
 
 @mcp.tool()
+@_requires_authoring
 def ui_delete_view(view_id: str, envelope: dict[str, Any] | None = None) -> dict[str, Any]:
     """Delete a view. Requires AUTHORING_ENABLED=true."""
     ctx = _parse_envelope(envelope)
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    if not _is_authoring_enabled():
-        return {
-            "error": "Authoring tools are disabled. Set AUTHORING_ENABLED=true",
-            "request_id": ctx.request_id,
-        }
-
-    runtime = _get_runtime()
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
-
-    deleted = runtime.view_manager.delete_view(view_id)
+    deleted = vm.delete_view(view_id)
+    _VIEW_RESOURCE_CACHE.pop(view_id, None)
     return {"deleted": deleted, "view_id": view_id, "request_id": ctx.request_id}
 
 
 @mcp.tool()
+@_requires_authoring
 async def ui_add_component(
     view_id: str,
     component_type: str,
@@ -612,28 +753,22 @@ async def ui_add_component(
 ) -> dict[str, Any]:
     """Add a component to a view. Requires AUTHORING_ENABLED=true."""
     ctx = _parse_envelope(envelope)
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    if not _is_authoring_enabled():
-        return {
-            "error": "Authoring tools are disabled. Set AUTHORING_ENABLED=true",
-            "request_id": ctx.request_id,
-        }
-
-    runtime = _get_runtime()
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
-
-    try:
-        component = runtime.view_manager.create_component(
-            component_type=component_type,
-            props=props,
-            styles=styles,
-            component_id=component_id,
-        )
-    except ValueError:
+    comp_type = COMPONENT_TYPES_BY_NAME.get(component_type)
+    if comp_type is None:
         return {"error": f"Invalid component type: {component_type}", "request_id": ctx.request_id}
 
-    view = await runtime.view_manager.add_component(view_id, component, position)
+    component = vm.create_component(
+        component_type=comp_type,
+        props=props,
+        styles=styles,
+        component_id=component_id,
+    )
+
+    view = await vm.add_component(view_id, component, position)
     if not view:
         return {"error": f"View not found: {view_id}", "request_id": ctx.request_id}
 
@@ -646,6 +781,7 @@ async def ui_add_component(
 
 
 @mcp.tool()
+@_requires_authoring
 async def ui_update_component(
     view_id: str,
     component_id: str,
@@ -655,18 +791,11 @@ async def ui_update_component(
 ) -> dict[str, Any]:
     """Update a component's properties or styles. Requires AUTHORING_ENABLED=true."""
     ctx = _parse_envelope(envelope)
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    if not _is_authoring_enabled():
-        return {
-            "error": "Authoring tools are disabled. Set AUTHORING_ENABLED=true",
-            "request_id": ctx.request_id,
-        }
-
-    runtime = _get_runtime()
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
-
-    component = await runtime.view_manager.update_component(view_id, component_id, props, styles)
+    component = await vm.update_component(view_id, component_id, props, styles)
     if not component:
         return {
             "error": f"Component not found: {component_id} in view {view_id}",
@@ -677,23 +806,17 @@ async def ui_update_component(
 
 
 @mcp.tool()
+@_requires_authoring
 async def ui_remove_component(
     view_id: str, component_id: str, envelope: dict[str, Any] | None = None
 ) -> dict[str, Any]:
     """Remove a component from a view. Requires AUTHORING_ENABLED=true."""
     ctx = _parse_envelope(envelope)
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    if not _is_authoring_enabled():
-        return {
-            "error": "Authoring tools are disabled. Set AUTHORING_ENABLED=true",
-            "request_id": ctx.request_id,
-        }
-
-    runtime = _get_runtime()
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
-
-    removed = await runtime.view_manager.remove_component(view_id, component_id)
+    removed = await vm.remove_component(view_id, component_id)
     return {
         "removed": removed,
         "component_id": component_id,
@@ -703,21 +826,15 @@ async def ui_remove_component(
 
 
 @mcp.tool()
+@_requires_authoring
 async def ui_push_view(view_id: str, envelope: dict[str, Any] | None = None) -> dict[str, Any]:
     """Push full view state to all subscribed clients. Requires AUTHORING_ENABLED=true."""
     ctx = _parse_envelope(envelope)
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
 
-    if not _is_authoring_enabled():
-        return {
-            "error": "Authoring tools are disabled. Set AUTHORING_ENABLED=true",
-            "request_id": ctx.request_id,
-        }
-
-    runtime = _get_runtime()
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
-
-    recipients = await runtime.view_manager.push_view(view_id)
+    recipients = await vm.push_view(view_id)
     return {
         "pushed": True,
         "view_id": view_id,
@@ -727,6 +844,7 @@ async def ui_push_view(view_id: str, envelope: dict[str, Any] | None = None) ->
 
 
 @mcp.tool()
+@_requires_authoring
 async def ui_create_dashboard(
     name: str,
     metrics: list[dict[str, Any]] | None = None,
@@ -736,47 +854,138 @@ async def ui_create_dashboard(
 ) -> dict[str, Any]:
     """Create a complete dashboard with multiple components. Requires AUTHORING_ENABLED=true."""
     ctx = _parse_envelope(envelope)
+    vm = _get_view_manager()
+    if vm is None:
+        return _not_initialized(ctx)
+
+    view = vm.create_view(name=name, layout={"type": "grid", "columns": 3})
+    components = [
+        vm.create_component(component_type=component_type, props=props)
+        for component_type, items in (
+            (ComponentType.METRIC, metrics),
+            (ComponentType.CHART, charts),
+            (ComponentType.TABLE, tables),
+        )
+        for props in items or []
+    ]
+    if components:
+        await vm.add_components(view.id, components)
 
-    if not _is_authoring_enabled():
-        return {
-            "error": "Authoring tools are disabled. Set AUTHORING_ENABLED=true",
-            "request_id": ctx.request_id,
-        }
+    return {
+        "created": True,
+        "view_id": view.id,
+        "view_name": name,
+        "components_added": len(components),
+        "component_ids": [c.id for c in components],
+        "request_id": ctx.request_id,
+    }
 
-    runtime = _get_runtime()
-    if not runtime.view_manager:
-        return {"error": "Runtime not initialized", "request_id": ctx.request_id}
 
-    view = runtime.view_manager.create_view(name=name, layout={"type": "grid", "columns": 3})
-    components_added = []
+# ============================================================================
+# Batch Tools - Run several tool calls in one round-trip
+# ============================================================================
 
-    for metric in metrics or []:
-        component = runtime.view_manager.create_component(
-            component_type=ComponentType.METRIC, props=metric
-        )
-        await runtime.view_manager.add_component(view.id, component)
-        components_added.append(component.id)
+# Built once at import; tool functions are returned undecorated by FastMCP
+_BATCH_TOOLS: dict[str, Callable[..., Any]] = {
+    fn.__name__: fn
+    for fn in (
+        ui_get_capabilities,
+        ui_health_check,
+        ui_describe_config_schema,
+        ui_get_view_registry,
+        ui_get_component_registry,
+        ui_list_adapters,
+        ui_list_resources,
+        ui_list_prompts,
+        ui_list_views,
+        ui_get_view,
+        ui_get_push_channel_status,
+        ui_get_view_history,
+        ui_connect_client,
+        ui_disconnect_client,
+        ui_subscribe,
+        ui_authoring_get_status,
+        ui_create_view,
+        ui_delete_view,
+        ui_add_component,
+        ui_update_component,
+        ui_remove_component,
+        ui_push_view,
+        ui_create_dashboard,
+    )
+}
+_ENVELOPE_TOOLS = frozenset(
+    name for name, fn in _BATCH_TOOLS.items() if "envelope" in inspect.signature(fn).parameters
+)
+
+
+async def _run_operation(operation: dict[str, Any], envelope: dict[str, Any] | None) -> Any:
+    """Run a single batch operation and return the tool's result."""
+    name = operation.get("tool")
+    tool = _BATCH_TOOLS.get(name) if isinstance(name, str) else None
+    if tool is None:
+        return {"error": f"Unknown tool: {name}"}
+
+    args = operation.get("args") or {}
+    if not isinstance(args, dict):
+        return {"error": f"Invalid arguments for {name}: args must be an object"}
+    args = dict(args)
+    if envelope and name in _ENVELOPE_TOOLS:
+        args.setdefault("envelope", envelope)
 
-    for chart in charts or []:
-        component = runtime.view_manager.create_component(
-            component_type=ComponentType.CHART, props=chart
-        )
-        await runtime.view_manager.add_component(view.id, component)
-        components_added.append(component.id)
+    try:
+        inspect.signature(tool).bind(**args)
+    except TypeError as e:
+        return {"error": f"Invalid arguments for {name}: {e}"}
 
-    for table in tables or []:
-        component = runtime.view_manager.create_component(
-            component_type=ComponentType.TABLE, props=table
-        )
-        await runtime.view_manager.add_component(view.id, component)
-        components_added.append(component.id)
+    try:
+        result = tool(**args)
+        if inspect.isawaitable(result):
+            result = await result
+    except Exception as e:
+        logger.exception("Batch operation %s failed", name)
+        return {"error": f"{name} failed: {e}"}
+    return result
+
+
+@mcp.tool()
+async def ui_batch_execute(
+    operations: list[dict[str, Any]],
+    stop_on_error: bool = True,
+    envelope: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Run several UI tools in a single call.
 
+    Operations always run one at a time, in order; batching saves the
+    round-trip per tool call, not the tools' own work.
+
+    Args:
+        operations: List of {"tool": "<tool name>", "args": {...}} entries
+        stop_on_error: Stop at the first error. When false, every
+            operation is attempted.
+        envelope: Optional context envelope, forwarded to operations that
+            do not pass their own
+
+    Returns per-operation results in input order and a list of errors.
+    """
+    ctx = _parse_envelope(envelope)
+
+    results = []
+    for operation in operations:
+        result = await _run_operation(operation, envelope)
+        results.append(result)
+        if stop_on_error and isinstance(result, dict) and "error" in result:
+            break
+
+    errors = [
+        {"index": i, "tool": operations[i].get("tool"), "error": result["error"]}
+        for i, result in enumerate(results)
+        if isinstance(result, dict) and "error" in result
+    ]
     return {
-        "created": True,
-        "view_id": view.id,
-        "view_name": name,
-        "components_added": len(components_added),
-        "component_ids": components_added,
+        "results": results,
+        "errors": errors,
+        "completed": len(results),
         "request_id": ctx.request_id,
     }
 
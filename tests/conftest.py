@@ -1,28 +1,64 @@
-import os
-import shutil
-import tempfile
-
 import pytest
-import yaml
 
+from ui_module.engine.config import clear_config_cache
 from ui_module.engine.runtime import UIRuntime
+from ui_module.engine.serialization import dumps
+from ui_module.engine.store.view_store import InMemoryViewStore
 
 
 @pytest.fixture
-def config_dir():
-    temp_dir = tempfile.mkdtemp()
-    config_path = os.path.join(temp_dir, "config")
-    views_path = os.path.join(config_path, "views")
-    os.makedirs(views_path)
+def config_dir(tmp_path):
+    config_path = tmp_path / "config"
+    (config_path / "views").mkdir(parents=True)
 
-    # Create settings.yaml
-    with open(os.path.join(config_path, "settings.yaml"), "w") as f:
-        yaml.dump({"routes": {"/": "index", "/login": "login"}}, f)
+    (config_path / "settings.yaml").write_text(
+        """\
+routes:
+  /: index
+  /login: login
+"""
+    )
 
     yield config_path
-    shutil.rmtree(temp_dir)
+    clear_config_cache()
 
 
 @pytest.fixture
 def runtime(config_dir):
-    return UIRuntime(config_dir)
+    return UIRuntime(config_dir, store=InMemoryViewStore())
+
+
+@pytest.fixture(scope="session")
+def seeded_config_dir(tmp_path_factory):
+    """Config dir written once and shared by the whole test session.
+
+    Tests must treat it as read-only; ``index_path`` seeds its index view.
+    """
+    config_path = tmp_path_factory.mktemp("seeded") / "config"
+    (config_path / "views").mkdir(parents=True)
+
+    (config_path / "settings.yaml").write_text(
+        """\
+routes:
+  /: index
+"""
+    )
+    return config_path
+
+
+@pytest.fixture(scope="session")
+def index_path(seeded_config_dir):
+    """Path of the seeded index view, written once per test session."""
+    path = seeded_config_dir / "views" / "index.json"
+    path.write_text(
+        dumps(
+            {
+                "id": "index",
+                "name": "Home",
+                "components": [
+                    {"id": "greeting", "type": "text", "props": {"content": "Hello"}},
+                ],
+            }
+        )
+    )
+    return path
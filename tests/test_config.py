@@ -1,53 +1,24 @@
 """Tests for ConfigLoader."""
 
-import tempfile
-from pathlib import Path
+import os
 
 import pytest
 
 from ui_module.engine import ConfigLoader
+from ui_module.engine.config import config_cache_info
 
 
-class TestConfigLoader:
-    """Tests for ConfigLoader."""
-
-    def test_default_settings(self):
-        """Should return default settings when no config file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            loader = ConfigLoader(tmpdir)
-            settings = loader.load_settings()
-
-            assert settings.authoring_enabled is False
-            assert settings.storage_backend == "memory"
-            assert settings.default_adapter == "json"
-
-    def test_load_settings_from_file(self):
-        """Should load settings from yaml file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create settings file
-            settings_path = Path(tmpdir) / "settings.yaml"
-            settings_path.write_text("""
-authoring_enabled: true
-storage_backend: redis
-max_views: 500
-""")
+@pytest.fixture(scope="module")
+def views_config_dir(tmp_path_factory):
+    """Config dir with sample views and no settings file, built once per module.
 
-            loader = ConfigLoader(tmpdir)
-            settings = loader.load_settings()
-
-            assert settings.authoring_enabled is True
-            assert settings.storage_backend == "redis"
-            assert settings.max_views == 500
-
-    def test_load_view_definitions(self):
-        """Should load view definitions from views directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create views directory
-            views_dir = Path(tmpdir) / "views"
-            views_dir.mkdir()
+    Tests must treat it as read-only; tests that write use ``tmp_path``.
+    """
+    config_dir = tmp_path_factory.mktemp("config")
+    views_dir = config_dir / "views"
+    views_dir.mkdir()
 
-            # Create view file
-            (views_dir / "dashboard.yaml").write_text("""
+    (views_dir / "dashboard.yaml").write_text("""
 id: test-dashboard
 name: Test Dashboard
 layout:
@@ -60,21 +31,7 @@ components:
 tags:
   - test
 """)
-
-            loader = ConfigLoader(tmpdir)
-            definitions = loader.load_view_definitions()
-
-            assert "test-dashboard" in definitions
-            assert definitions["test-dashboard"].name == "Test Dashboard"
-            assert len(definitions["test-dashboard"].components) == 1
-
-    def test_view_definition_to_view(self):
-        """Should convert ViewDefinition to UIView."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            views_dir = Path(tmpdir) / "views"
-            views_dir.mkdir()
-
-            (views_dir / "test.yaml").write_text("""
+    (views_dir / "test.yaml").write_text("""
 id: test-view
 name: Test View
 components:
@@ -84,27 +41,137 @@ components:
       label: Users
       value: 100
 """)
+    return config_dir
+
+
+class TestConfigLoader:
+    """Tests for ConfigLoader."""
+
+    def test_default_settings(self, views_config_dir):
+        """Should return default settings when no config file."""
+        loader = ConfigLoader(views_config_dir)
+        settings = loader.load_settings()
+
+        assert settings.authoring_enabled is False
+        assert settings.storage_backend == "memory"
+        assert settings.default_adapter == "json"
+
+    def test_load_settings_from_file(self, tmp_path):
+        """Should load settings from yaml file."""
+        # Create settings file
+        settings_path = tmp_path / "settings.yaml"
+        settings_path.write_text("""
+authoring_enabled: true
+storage_backend: redis
+max_views: 500
+""")
+
+        loader = ConfigLoader(tmp_path)
+        settings = loader.load_settings()
+
+        assert settings.authoring_enabled is True
+        assert settings.storage_backend == "redis"
+        assert settings.max_views == 500
+
+    def test_load_view_definitions(self, views_config_dir):
+        """Should load view definitions from views directory."""
+        loader = ConfigLoader(views_config_dir)
+        definitions = loader.load_view_definitions()
+
+        assert "test-dashboard" in definitions
+        assert definitions["test-dashboard"].name == "Test Dashboard"
+        assert len(definitions["test-dashboard"].components) == 1
+
+    def test_view_definition_to_view(self, views_config_dir):
+        """Should convert ViewDefinition to UIView."""
+        loader = ConfigLoader(views_config_dir)
+        definitions = loader.load_view_definitions()
+
+        view = definitions["test-view"].to_view()
+
+        assert view.id == "test-view"
+        assert view.name == "Test View"
+        assert len(view.components) == 1
+        assert view.components[0].props["label"] == "Users"
+
+    def test_yml_views_and_symlinks(self, tmp_path):
+        """Should load .yml views and skip symlinked view files."""
+        views_dir = tmp_path / "views"
+        views_dir.mkdir()
+        (views_dir / "short.yml").write_text("id: short\nname: Short\n")
+        outside = tmp_path / "outside.yaml"
+        outside.write_text("id: outside\nname: Outside\n")
+        (views_dir / "linked.yaml").symlink_to(outside)
 
-            loader = ConfigLoader(tmpdir)
-            definitions = loader.load_view_definitions()
+        definitions = ConfigLoader(tmp_path).load_view_definitions()
 
-            view = definitions["test-view"].to_view()
+        assert set(definitions) == {"short"}
 
-            assert view.id == "test-view"
-            assert view.name == "Test View"
-            assert len(view.components) == 1
-            assert view.components[0].props["label"] == "Users"
+    def test_json_views(self, tmp_path):
+        """Should load .json view files alongside YAML ones."""
+        views_dir = tmp_path / "views"
+        views_dir.mkdir()
+        (views_dir / "home.json").write_text(
+            '{"id": "home", "name": "Home", "components": [{"type": "text"}]}'
+        )
+        (views_dir / "other.yaml").write_text("id: other\nname: Other\n")
+        loader = ConfigLoader(tmp_path)
 
-    def test_path_traversal_protection(self):
+        definitions = loader.load_view_definitions()
+
+        assert set(definitions) == {"home", "other"}
+        assert len(definitions["home"].components) == 1
+
+    def test_reparse_after_edit(self, tmp_path):
+        """Should reuse parses across loaders until the file changes."""
+        settings_path = tmp_path / "settings.yaml"
+        settings_path.write_text("max_views: 500\n")
+
+        first = ConfigLoader(tmp_path).load_settings()
+        first.feature_flags["mutated"] = True
+        hits = config_cache_info()["hits"]
+        second = ConfigLoader(tmp_path).load_settings()
+
+        assert config_cache_info()["hits"] == hits + 1
+        assert second.max_views == 500
+        assert second.feature_flags == {}
+
+        settings_path.write_text("max_views: 600\n")
+        stat = settings_path.stat()
+        os.utime(settings_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert ConfigLoader(tmp_path).load_settings().max_views == 600
+
+    def test_path_traversal_protection(self, tmp_path):
         """Should reject path traversal attempts."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            loader = ConfigLoader(tmpdir)
+        loader = ConfigLoader(tmp_path)
 
-            # Try to access parent directory
-            bad_path = Path(tmpdir) / ".." / "etc" / "passwd"
+        # Try to access parent directory
+        bad_path = tmp_path / ".." / "etc" / "passwd"
 
-            with pytest.raises(ValueError, match="Path traversal"):
-                loader._validate_path(bad_path)
+        with pytest.raises(ValueError, match="Path traversal"):
+            loader._validate_path(bad_path)
+
+    def test_sibling_prefix_rejected(self, tmp_path):
+        """Should reject paths in a sibling dir sharing the config_dir prefix."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        loader = ConfigLoader(config_dir)
+
+        loader._validate_path(config_dir / "settings.yaml")
+        with pytest.raises(ValueError, match="Path traversal"):
+            loader._validate_path(tmp_path / "config-other" / "settings.yaml")
+
+    def test_symlink_rejected(self, tmp_path):
+        """Should reject symlinks even when they point inside config_dir."""
+        target = tmp_path / "settings.yaml"
+        target.write_text("max_views: 1\n")
+        link = tmp_path / "linked.yaml"
+        link.symlink_to(target)
+        loader = ConfigLoader(tmp_path)
+
+        with pytest.raises(ValueError, match="Symlink rejected"):
+            loader._validate_path(link)
 
     def test_get_config_schema(self):
         """Should return JSON schema."""
@@ -114,3 +181,10 @@ components:
         assert schema["$schema"] == "http://json-schema.org/draft-07/schema#"
         assert "settings" in schema["properties"]
         assert "view_definition" in schema["properties"]
+
+    def test_config_schema_not_shared(self):
+        """Should not let callers mutate the schema for everyone else."""
+        loader = ConfigLoader()
+        loader.get_config_schema()["properties"]["settings"]["properties"].clear()
+
+        assert "max_views" in loader.get_config_schema()["properties"]["settings"]["properties"]
@@ -1,5 +1,7 @@
 """Tests for context envelope."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from ui_module.engine import ContextEnvelope
@@ -60,6 +62,13 @@ class TestContextEnvelope:
         assert with_tool.tenant_id == "acme"
         assert envelope.tool_name is None  # Original unchanged
 
+    def test_immutable(self):
+        """Should reject attribute assignment after creation."""
+        envelope = ContextEnvelope(tenant_id="acme")
+
+        with pytest.raises(FrozenInstanceError):
+            envelope.tenant_id = "other"  # type: ignore[misc]
+
     def test_attribute_validation_count(self):
         """Should reject too many attributes."""
         attrs = {f"key_{i}": f"value_{i}" for i in range(MAX_ATTRIBUTES + 1)}
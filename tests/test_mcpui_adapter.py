@@ -125,6 +125,19 @@ class TestMcpUiAdapter:
         assert "Sales" in content
         assert result.metadata["component_count"] == 2
 
+    def test_render_chart_big_int(self):
+        """Should embed chart data holding integers beyond 64 bits."""
+        adapter = McpUiAdapter()
+        component = UIComponent(
+            id="chart-1",
+            component_type=ComponentType.CHART,
+            props={"data": [{"value": 2**70}]},
+        )
+
+        result = adapter.render_component(component)
+
+        assert str(2**70) in result.content["content"]
+
     def test_resource_type_configuration(self):
         """Should respect resource type configuration."""
         adapter = McpUiAdapter(resource_type=UIResourceType.INLINE_HTML)
@@ -78,3 +78,20 @@ class TestPrompts:
         arg_names = [a["name"] for a in dashboard_prompt["arguments"]]
         assert "name" in arg_names
         assert "purpose" in arg_names
+
+    def test_list_prompts_not_shared(self):
+        """Should not let callers mutate the listing others receive."""
+        first = prm.list_prompts()
+        first[0]["arguments"][0]["required"] = "changed"
+        first[0]["arguments"].clear()
+
+        second = prm.list_prompts()
+        assert second[0]["arguments"]
+        assert second[0]["arguments"][0]["required"] != "changed"
+
+    def test_get_prompt_argument_values_not_expanded(self):
+        """Should not substitute placeholders that appear inside argument values."""
+        result = prm.get_prompt("design_form", {"purpose": "{fields}", "fields": "Name"})
+
+        content = result["messages"][0]["content"]["text"]
+        assert "Create a form for: {fields}" in content
@@ -136,3 +136,45 @@ class TestPushChannel:
 
         assert len(subscribers) == 1
         assert subscribers[0].client_id == "client-1"
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_cleared_on_disconnect(self):
+        """Should stop pushing to clients that unsubscribed or reconnected."""
+        channel = PushChannel()
+        channel.connect("client-1")
+        channel.connect("client-2")
+        channel.connect("client-3")
+        channel.subscribe("client-1", "view-1")
+        channel.subscribe("client-2", "*")
+        channel.subscribe("client-3", "view-1")
+
+        channel.unsubscribe("client-1", "view-1")
+        channel.disconnect("client-2")
+        channel.connect("client-3")
+
+        update = ViewUpdate(view_id="view-1", action="full", payload={}, version=1)
+
+        assert await channel.push(update) == 0
+        assert channel.get_subscribers("view-1") == []
+
+    @pytest.mark.asyncio
+    async def test_push_isolates_failing_callbacks(self):
+        """Should deliver to healthy clients when another callback fails."""
+        channel = PushChannel()
+        received = []
+
+        async def failing(update):
+            raise RuntimeError("boom")
+
+        async def healthy(update):
+            received.append(update.view_id)
+
+        channel.connect("client-1", callback=failing)
+        channel.connect("client-2", callback=healthy)
+        channel.subscribe("client-1", "view-1")
+        channel.subscribe("client-2", "view-1")
+
+        update = ViewUpdate(view_id="view-1", action="full", payload={}, version=1)
+
+        assert await channel.push(update) == 1
+        assert received == ["view-1"]
@@ -1,5 +1,7 @@
 """Tests for component registry."""
 
+import pytest
+
 from ui_module.engine import (
     ComponentDefinition,
     ComponentRegistry,
@@ -47,6 +49,24 @@ class TestComponentRegistry:
         assert retrieved is not None
         assert retrieved.name == "MyWidget"
 
+    def test_register_does_not_leak_between_registries(self):
+        """Should keep registrations local to one registry."""
+        first = ComponentRegistry()
+        second = ComponentRegistry()
+
+        first.register(
+            ComponentDefinition(
+                component_type=ComponentType.TEXT,
+                name="Override",
+                description="Overridden text",
+                schema={},
+            )
+        )
+
+        assert first.get(ComponentType.TEXT).name == "Override"
+        assert second.get(ComponentType.TEXT).name == "Text"
+        assert ComponentRegistry().get(ComponentType.TEXT).name == "Text"
+
     def test_create_component_with_defaults(self):
         """Should apply default props when creating components."""
         registry = ComponentRegistry()
@@ -81,3 +101,35 @@ class TestComponentRegistry:
         assert "components" in data
         assert len(data["components"]) > 0
         assert all("type" in c for c in data["components"])
+
+    def test_builtins_read_only(self):
+        """Should not let one registry change the built-ins another sees."""
+        text_def = ComponentRegistry().get(ComponentType.TEXT)
+
+        with pytest.raises(TypeError):
+            text_def.schema["properties"]["x"] = 1
+        exported = text_def.to_dict()
+        exported["schema"]["properties"]["x"] = 1
+        exported["default_props"]["variant"] = "h1"
+
+        other = ComponentRegistry().get(ComponentType.TEXT)
+        assert "x" not in other.schema["properties"]
+        assert other.default_props["variant"] == "body"
+
+    def test_to_dict_refreshed_after_register(self):
+        """Should include newly registered components in the export."""
+        registry = ComponentRegistry()
+        before = registry.to_dict()
+
+        registry.register(
+            ComponentDefinition(
+                component_type=ComponentType.CUSTOM,
+                name="MyWidget",
+                description="A custom widget",
+                schema={"type": "object"},
+            )
+        )
+        after = registry.to_dict()
+
+        assert registry.to_dict() is not after
+        assert len(after["components"]) == len(before["components"]) + 1
@@ -4,6 +4,8 @@ import json
 
 from ui_module import resources as res
 from ui_module.engine import ComponentRegistry, ViewManager
+from ui_module.engine.models import ComponentType
+from ui_module.engine.registry import ComponentDefinition
 
 
 class TestResources:
@@ -19,6 +21,25 @@ class TestResources:
         assert "components" in content
         assert len(content["components"]) > 0
 
+    def test_all_components_resource_cached_per_registry_version(self):
+        """Should reuse serialized content until the registry changes."""
+        registry = ComponentRegistry()
+        first = res.get_all_components_resource(registry)["content"]
+
+        assert res.get_all_components_resource(registry)["content"] is first
+
+        registry.register(
+            ComponentDefinition(
+                component_type=ComponentType.TEXT,
+                name="Custom Text",
+                description="Overridden",
+                schema={},
+            )
+        )
+        content = json.loads(res.get_all_components_resource(registry)["content"])
+
+        assert "Custom Text" in [c["name"] for c in content["components"]]
+
     def test_get_component_schema_resource(self):
         """Should return schema for specific component."""
         registry = ComponentRegistry()
@@ -56,6 +77,13 @@ class TestResources:
         assert content["name"] == "Dashboard Template"
         assert "suggested_components" in content
 
+    def test_get_template_resource_unknown(self):
+        """Should return a valid JSON error for unknown templates."""
+        result = res.get_template_resource('bad"name')
+
+        content = json.loads(result["content"])
+        assert content == {"error": 'Unknown template: bad"name'}
+
     def test_get_view_resource(self):
         """Should return view as resource."""
         manager = ViewManager()
@@ -67,6 +95,18 @@ class TestResources:
         content = json.loads(result["content"])
         assert content["name"] == "Test View"
 
+    async def test_get_view_resource_big_int(self):
+        """Should serve views whose props hold integers beyond 64 bits."""
+        manager = ViewManager()
+        manager.create_view(name="Test View", view_id="test-view")
+        component = manager.create_component("metric", props={"value": 2**70})
+        await manager.add_component("test-view", component)
+
+        result = res.get_view_resource("test-view", manager)
+
+        content = json.loads(result["content"])
+        assert content["components"][0]["props"]["value"] == 2**70
+
     def test_get_docs_resource(self):
         """Should return documentation."""
         result = res.get_docs_resource("getting-started")
@@ -1,6 +1,8 @@
 """Tests for UIRuntime."""
 
-from ui_module.engine import UIRuntime, reset_runtime
+import asyncio
+
+from ui_module.engine import InMemoryViewStore, UIRuntime, reset_runtime
 
 
 class TestUIRuntime:
@@ -78,6 +80,50 @@ class TestUIRuntime:
         assert len(registry["views"]) == 1
         assert registry["views"][0]["name"] == "Test View"
 
+    def test_loads_views_from_config(self, seeded_config_dir, index_path):
+        """Should load view definitions from the config dir on initialize."""
+        runtime = UIRuntime(seeded_config_dir)
+        runtime.initialize()
+
+        view = runtime.view_manager.get_view(index_path.stem)
+
+        assert view.name == "Home"
+        assert view.components[0].props["content"] == "Hello"
+
+    def test_injected_store(self, config_dir):
+        """Should use a store passed to the constructor."""
+        store = InMemoryViewStore()
+        runtime = UIRuntime(config_dir, store=store)
+        runtime.initialize()
+
+        view = runtime.view_manager.create_view(name="Injected")
+
+        assert store.get(view.id) is view
+
+    async def test_shutdown_delivers_queued_pushes(self, config_dir):
+        """Should deliver background component pushes on shutdown."""
+        runtime = UIRuntime(config_dir)
+        runtime.initialize()
+        manager = runtime.view_manager
+        received = []
+
+        async def callback(update):
+            await asyncio.sleep(0)
+            received.append(update.action)
+
+        manager.push_channel.connect("client-1", callback=callback)
+        manager.push_channel.subscribe("client-1", "*")
+        view = manager.create_view(name="Test")
+        component = manager.create_component(component_type="text")
+        await manager.add_component(view.id, component)
+        await manager.update_component(view.id, component.id, props={"content": "Hi"})
+
+        assert received == []
+
+        await runtime.shutdown()
+
+        assert received == ["add_component", "update_component"]
+
     def test_get_authoring_status(self):
         """Should return authoring status."""
         runtime = UIRuntime()
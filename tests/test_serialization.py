@@ -0,0 +1,62 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+
+import pytest
+
+from ui_module.engine import ComponentType, UIComponent, UIView, serialization
+from ui_module.engine.serialization import dumps
+
+
+class TestSerialization:
+    """Tests for dumps."""
+
+    def test_dumps_round_trip(self):
+        """Should produce JSON that decodes to the input."""
+        data = {"name": "Test", "values": [1, 2.5, True, None]}
+
+        assert json.loads(dumps(data)) == data
+        assert json.loads(dumps(data, indent=True)) == data
+
+    def test_dumps_indent(self):
+        """Should pretty-print when indent is requested."""
+        assert "\n  " in dumps({"a": 1}, indent=True)
+
+    def test_big_int(self):
+        """Should encode integers beyond 64 bits."""
+        data = {"n": 2**70, "nested": [{"m": -(2**65)}]}
+
+        assert json.loads(dumps(data)) == data
+        assert json.loads(dumps(data, indent=True)) == data
+
+    def test_non_ascii_text(self):
+        """Should write non-ASCII text as raw UTF-8."""
+        data = {"label": "Umsatz €", "emoji": "📈"}
+
+        assert dumps(data) == '{"label":"Umsatz €","emoji":"📈"}'
+        assert json.loads(dumps(data, indent=True)) == data
+
+    def test_same_output_without_orjson(self, monkeypatch):
+        """Should produce the same text whether or not orjson is installed."""
+        view = UIView(id="v1", name="Vue été", components=[])
+        data = {"view": view, "values": [1, 2.5, None, "ü"], "empty": {}}
+        fast = (dumps(data), dumps(data, indent=True))
+
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert (dumps(data), dumps(data, indent=True)) == fast
+
+    def test_unsupported_type(self):
+        """Should reject objects it cannot encode."""
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+    def test_models_encoded(self):
+        """Should encode views and components nested in a document."""
+        component = UIComponent(id="c1", component_type=ComponentType.TEXT)
+        view = UIView(id="v1", name="View", components=[component])
+
+        result = json.loads(dumps({"view": view}))
+
+        assert result["view"]["id"] == "v1"
+        assert result["view"]["components"][0]["type"] == "text"
@@ -0,0 +1,295 @@
+"""Tests for MCP server tools."""
+
+import asyncio
+import json
+
+import pytest
+
+from ui_module import server
+
+
+@pytest.fixture
+def authoring_config(tmp_path, monkeypatch):
+    """Point the server at an empty config dir with authoring enabled."""
+    (tmp_path / "settings.yaml").write_text("authoring_enabled: true\n")
+    monkeypatch.setenv("UI_CONFIG_DIR", str(tmp_path))
+    monkeypatch.delenv("AUTHORING_ENABLED", raising=False)
+    server._reset_runtime()
+    yield tmp_path
+    server._reset_runtime()
+
+
+@pytest.fixture
+def authoring_disabled(tmp_path, monkeypatch):
+    """Point the server at an empty config dir with authoring disabled."""
+    monkeypatch.setenv("UI_CONFIG_DIR", str(tmp_path))
+    monkeypatch.delenv("AUTHORING_ENABLED", raising=False)
+    server._reset_runtime()
+    yield tmp_path
+    server._reset_runtime()
+
+
+class TestServer:
+    """Tests for MCP server tools."""
+
+    def test_runtime_cached(self, authoring_config):
+        """Should resolve the runtime once and reuse it."""
+        assert server._get_runtime() is server._get_runtime()
+
+    async def test_lifespan_delivers_queued_pushes(self, authoring_config):
+        """Should deliver queued component pushes when the server stops."""
+        received = []
+
+        async def callback(update):
+            await asyncio.sleep(0)
+            received.append(update.action)
+
+        async with server._lifespan(server.mcp):
+            vm = server._get_view_manager()
+            vm.push_channel.connect("client-1", callback=callback)
+            vm.push_channel.subscribe("client-1", "*")
+            server.ui_create_view(name="Test", view_id="test")
+            await server.ui_add_component(view_id="test", component_type="text")
+
+        assert received == ["add_component"]
+
+    def test_static_payloads_not_shared(self, authoring_config):
+        """Should not let callers mutate what later callers receive."""
+        server.ui_list_prompts()["prompts"][0]["arguments"].clear()
+        server.ui_get_capabilities()["component_types"].clear()
+        server.ui_list_adapters()["adapters"].clear()
+        server.ui_get_component_registry()["components"].clear()
+        server.ui_list_resources()["resources"][0]["uri"] = "changed"
+
+        assert server.ui_list_prompts()["prompts"][0]["arguments"]
+        assert server.ui_get_capabilities()["component_types"]
+        assert server.ui_list_adapters()["adapters"]
+        assert server.ui_get_component_registry()["components"]
+        assert server.ui_list_resources()["resources"][0]["uri"] == "ui://components"
+
+    def test_reset_runtime(self, authoring_config):
+        """Should resolve a fresh runtime after reset."""
+        first = server._get_runtime()
+        server._reset_runtime()
+
+        assert server._get_runtime() is not first
+
+    def test_view_manager_bound_with_runtime(self, authoring_config):
+        """Should bind the view manager when the runtime is resolved."""
+        runtime = server._get_runtime()
+
+        assert server._get_view_manager() is runtime.view_manager
+
+    def test_refresh_authoring_flag(self, authoring_disabled, monkeypatch):
+        """Should pick up AUTHORING_ENABLED changes after a refresh."""
+        assert server._is_authoring_enabled() is False
+
+        monkeypatch.setenv("AUTHORING_ENABLED", "true")
+        server._refresh_authoring_flag()
+
+        assert server._is_authoring_enabled() is True
+
+    def test_authoring_enabled_from_settings(self, authoring_config):
+        """Should enable authoring from settings.yaml."""
+        result = server.ui_create_view(name="Test", view_id="test")
+
+        assert result["created"] is True
+        assert result["view"]["id"] == "test"
+
+    def test_list_views(self, authoring_config):
+        """Should list created views."""
+        server.ui_create_view(name="Test", view_id="test")
+
+        result = server.ui_list_views()
+
+        assert result["total"] == 1
+        assert result["views"][0]["id"] == "test"
+        assert "request_id" in result
+
+    def test_request_id_from_envelope(self):
+        """Should echo the caller's request_id."""
+        ctx = server._parse_envelope({"request_id": "req-1"})
+
+        assert ctx.request_id == "req-1"
+
+    def test_request_id_without_envelope(self):
+        """Should generate a stable request_id when no envelope is passed."""
+        ctx = server._parse_envelope(None)
+
+        assert ctx.request_id
+        assert ctx.request_id == ctx.request_id
+
+    async def test_batch_execute(self, authoring_config):
+        """Should run operations in order and return their results."""
+        result = await server.ui_batch_execute(
+            [
+                {"tool": "ui_create_view", "args": {"name": "Batch", "view_id": "batch"}},
+                {
+                    "tool": "ui_add_component",
+                    "args": {"view_id": "batch", "component_type": "text"},
+                },
+            ],
+            envelope={"request_id": "req-batch"},
+        )
+
+        assert result["errors"] == []
+        assert result["completed"] == 2
+        assert result["results"][1]["added"] is True
+        assert result["results"][1]["request_id"] == "req-batch"
+
+    async def test_batch_execute_stop_on_error(self, authoring_config):
+        """Should stop at the first failing operation."""
+        result = await server.ui_batch_execute(
+            [
+                {"tool": "ui_unknown"},
+                {"tool": "ui_list_views"},
+            ]
+        )
+
+        assert result["completed"] == 1
+        assert result["errors"][0]["index"] == 0
+
+    async def test_batch_execute_continue_on_error(self, authoring_config):
+        """Should attempt every operation when stop_on_error is false."""
+        result = await server.ui_batch_execute(
+            [
+                {"tool": "ui_list_views", "args": {"bad_arg": 1}},
+                {"tool": "ui_list_views"},
+            ],
+            stop_on_error=False,
+        )
+
+        assert result["completed"] == 2
+        assert len(result["errors"]) == 1
+        assert result["results"][1]["total"] == 0
+
+    async def test_batch_execute_invalid_args(self, authoring_config):
+        """Should report non-object args as a per-operation error."""
+        result = await server.ui_batch_execute(
+            [
+                {"tool": "ui_list_views", "args": "xy"},
+                {"tool": "ui_list_views"},
+            ],
+            stop_on_error=False,
+        )
+
+        assert result["completed"] == 2
+        assert result["errors"][0]["index"] == 0
+        assert "Invalid arguments" in result["errors"][0]["error"]
+
+    async def test_batch_execute_tool_error(self, authoring_config, monkeypatch):
+        """Should report a TypeError raised inside a tool as a tool failure."""
+
+        def broken(view_id: str) -> dict:
+            raise TypeError("boom")
+
+        monkeypatch.setitem(server._BATCH_TOOLS, "ui_get_view", broken)
+        result = await server.ui_batch_execute([{"tool": "ui_get_view", "args": {"view_id": "x"}}])
+
+        assert result["errors"][0]["error"] == "ui_get_view failed: boom"
+
+    async def test_batch_execute_in_order(self, authoring_config):
+        """Should run every operation in order when stop_on_error is false."""
+        result = await server.ui_batch_execute(
+            [
+                {"tool": "ui_create_view", "args": {"name": "Batch", "view_id": "batch"}},
+                {
+                    "tool": "ui_add_component",
+                    "args": {"view_id": "batch", "component_type": "text"},
+                },
+                {"tool": "ui_get_view", "args": {"view_id": "batch"}},
+                {"tool": "ui_delete_view", "args": {"view_id": "batch"}},
+                {"tool": "ui_list_views"},
+            ],
+            stop_on_error=False,
+        )
+
+        assert result["errors"] == []
+        assert len(result["results"][2]["content"]["components"]) == 1
+        assert result["results"][4]["total"] == 0
+
+    async def test_create_dashboard(self, authoring_config):
+        """Should create a dashboard with all requested components."""
+        result = await server.ui_create_dashboard(
+            name="Ops",
+            metrics=[{"label": "Users", "value": 1}],
+            charts=[{"chart_type": "line", "data": []}],
+        )
+
+        assert result["components_added"] == 2
+        view = server._get_runtime().view_manager.get_view(result["view_id"])
+        assert [c.id for c in view.components] == result["component_ids"]
+
+    async def test_view_resource_refreshed_after_edit(self, authoring_config):
+        """Should reuse the view resource body until the view changes."""
+        server.ui_create_view(name="Test", view_id="test")
+        first = server.resource_view("test")
+
+        assert server.resource_view("test") is first
+
+        await server.ui_add_component(view_id="test", component_type="text")
+        second = server.resource_view("test")
+
+        assert second is not first
+        assert '"text"' in second
+
+    def test_view_resource_cache_dropped_on_delete(self, authoring_config):
+        """Should drop the cached view resource body when the view is deleted."""
+        server.ui_create_view(name="Test", view_id="test")
+        server.resource_view("test")
+
+        server.ui_delete_view(view_id="test")
+
+        assert "test" not in server._VIEW_RESOURCE_CACHE
+
+    def test_component_resources_cached(self, authoring_config):
+        """Should serve cached component resource bodies."""
+        assert server.resource_all_components() is server.resource_all_components()
+        assert server.resource_component_schema("text") is server.resource_component_schema("text")
+        assert "error" in server.resource_component_schema("bogus")
+
+    async def test_get_view_handle(self, authoring_config):
+        """Should return a handle and serve not_modified for its version."""
+        server.ui_create_view(name="Test", view_id="test")
+
+        handle = server.ui_get_view("test", return_handle=True)
+
+        assert handle["uri"] == "ui://views/test"
+        assert "content" not in handle
+        version = str(handle["version"])
+        assert json.loads(server.resource_view_since("test", version))["not_modified"] is True
+
+        await server.ui_add_component(view_id="test", component_type="text")
+
+        assert json.loads(server.resource_view_since("test", version))["id"] == "test"
+
+    async def test_authoring_disabled(self, authoring_disabled):
+        """Should reject authoring tools, sync and async, when disabled."""
+        envelope = {"request_id": "req-off"}
+
+        created = server.ui_create_view(name="Test", envelope=envelope)
+        added = await server.ui_add_component(
+            view_id="test", component_type="text", envelope=envelope
+        )
+
+        for result in (created, added):
+            assert result["error"] == server._AUTHORING_DISABLED_ERR
+            assert result["request_id"] == "req-off"
+
+    async def test_authoring_tool_via_mcp(self, authoring_config):
+        """Should expose decorated tools with their original signature."""
+        server.ui_create_view(name="Test", view_id="test")
+
+        _, result = await server.mcp.call_tool(
+            "ui_add_component", {"view_id": "test", "component_type": "text"}
+        )
+
+        assert result["added"] is True
+
+    async def test_add_component_invalid_type(self, authoring_config):
+        """Should reject unknown component types."""
+        server.ui_create_view(name="Test", view_id="test")
+
+        result = await server.ui_add_component(view_id="test", component_type="bogus")
+
+        assert result["error"] == "Invalid component type: bogus"
@@ -1,5 +1,7 @@
 """Tests for ViewManager."""
 
+import asyncio
+
 import pytest
 
 from ui_module.engine import (
@@ -69,7 +71,7 @@ class TestViewManager:
         assert component.component_type == ComponentType.TEXT
         assert component.props["content"] == "Hello"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_add_component(self):
         """Should add component to view."""
         manager = ViewManager()
@@ -85,7 +87,56 @@ class TestViewManager:
         assert len(updated.components) == 1
         assert updated.components[0].props["label"] == "Users"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_add_components(self):
+        """Should add several components with one version bump and one update."""
+        manager = ViewManager()
+        view = manager.create_view(name="Test")
+        first = manager.create_component(component_type="text", props={"content": "A"})
+        await manager.add_component(view.id, first)
+        version = view.version
+        components = [
+            manager.create_component(component_type="metric", props={"label": "Users"}),
+            manager.create_component(component_type="text", props={"content": "B"}),
+        ]
+
+        updated = await manager.add_components(view.id, components, position=0)
+
+        assert updated is not None
+        assert [c.id for c in updated.components] == [components[0].id, components[1].id, first.id]
+        assert updated.version == version + 1
+        history = manager.store.get_history(view_id=view.id)
+        assert history[-1].action == "add_components"
+        assert len(history[-1].payload["components"]) == 2
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_push_async(self):
+        """Should deliver background pushes in order before a full push."""
+        manager = ViewManager(push_async=True)
+        received = []
+
+        async def callback(update):
+            await asyncio.sleep(0)
+            received.append(update.action)
+
+        manager.push_channel.connect("client-1", callback=callback)
+        manager.push_channel.subscribe("client-1", "*")
+        view = manager.create_view(name="Test")
+        component = manager.create_component(component_type="text")
+
+        await manager.add_component(view.id, component)
+        await manager.update_component(view.id, component.id, props={"content": "Hi"})
+        recipients = await manager.push_view(view.id)
+
+        assert recipients == 1
+        assert received == ["add_component", "update_component", "full"]
+
+        await manager.remove_component(view.id, component.id)
+        await manager.wait_for_pushes()
+
+        assert received[-1] == "remove_component"
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_update_component(self):
         """Should update component props."""
         manager = ViewManager()
@@ -106,7 +157,50 @@ class TestViewManager:
         assert updated.props["value"] == 200
         assert updated.props["label"] == "Users"  # unchanged
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_to_dict_reflects_updates(self):
+        """Should not serve a stale view dict after a component update."""
+        manager = ViewManager()
+        view = manager.create_view(name="Test")
+        component = manager.create_component(component_type="text", props={"content": "Hi"})
+        await manager.add_component(view.id, component)
+        before = view.to_dict()
+
+        await manager.update_component(view.id, component.id, styles={"color": "red"})
+        after = view.to_dict()
+
+        assert view.to_dict() is after
+        assert after["version"] > before["version"]
+        assert after["components"][0]["styles"] == {"color": "red"}
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_updated_at_iso_follows_updates(self):
+        """Should reformat updated_at_iso only after updated_at changes."""
+        manager = ViewManager()
+        view = manager.create_view(name="Test")
+        before = view.updated_at_iso
+
+        assert view.updated_at_iso is before
+        assert before == view.updated_at.isoformat()
+
+        await manager.add_component(view.id, manager.create_component(component_type="text"))
+
+        assert view.updated_at_iso == view.updated_at.isoformat()
+        assert view.to_dict()["updated_at"] == view.updated_at_iso
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_history_dicts_reused(self):
+        """Should serialize each recorded update once."""
+        manager = ViewManager()
+        view = manager.create_view(name="Test")
+        await manager.add_component(view.id, manager.create_component(component_type="text"))
+
+        update = manager.store.get_history(view_id=view.id)[-1]
+
+        assert update.to_dict() is update.to_dict()
+        assert update.to_dict()["action"] == "add_component"
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_remove_component(self):
         """Should remove component from view."""
         manager = ViewManager()
@@ -120,6 +214,22 @@ class TestViewManager:
         updated_view = manager.get_view(view.id)
         assert len(updated_view.components) == 0
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_update_after_remove(self):
+        """Should find components by id after earlier ones are removed."""
+        manager = ViewManager()
+        view = manager.create_view(name="Test")
+        first, second = (manager.create_component(component_type="text") for _ in range(2))
+        await manager.add_components(view.id, [first, second])
+        await manager.update_component(view.id, second.id, props={"content": "a"})
+
+        await manager.remove_component(view.id, first.id)
+        updated = await manager.update_component(view.id, second.id, props={"content": "b"})
+
+        assert updated is second
+        assert view.find_component(second.id) == 0
+        assert view.find_component(first.id) is None
+
     def test_render_json(self):
         """Should render view as JSON."""
         manager = ViewManager()
@@ -142,6 +252,24 @@ class TestViewManager:
         assert result.adapter_type == "mcp-ui"
         assert "inline_html" in result.content["type"]
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_render_cached_until_saved(self):
+        """Should reuse rendered content until the view changes."""
+        manager = ViewManager()
+        view = manager.create_view(name="Test")
+        first = manager.render(view.id, adapter_type="json")
+        again = manager.render(view.id, adapter_type="json")
+
+        assert again.content is first.content
+        assert again is not first
+        assert again.rendered_at >= first.rendered_at
+
+        await manager.add_component(view.id, manager.create_component(component_type="text"))
+        second = manager.render(view.id, adapter_type="json")
+
+        assert second.content is not first.content
+        assert len(second.content["components"]) == 1
+
     def test_list_adapters(self):
         """Should list available adapters."""
         manager = ViewManager()
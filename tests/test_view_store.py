@@ -0,0 +1,62 @@
+"""Tests for InMemoryViewStore."""
+
+from ui_module.engine.models import UIView, ViewUpdate
+from ui_module.engine.store.view_store import InMemoryViewStore
+
+
+def _update(view_id: str, version: int) -> ViewUpdate:
+    return ViewUpdate(view_id=view_id, action="full", payload={}, version=version)
+
+
+class TestInMemoryViewStore:
+    """Tests for InMemoryViewStore history."""
+
+    def test_history_filtered_by_view(self):
+        """Should return the latest updates for one view, oldest first."""
+        store = InMemoryViewStore()
+        for version in range(5):
+            store.record_update(_update("a", version))
+            store.record_update(_update("b", version))
+
+        history = store.get_history(view_id="a", limit=3)
+
+        assert [u.version for u in history] == [2, 3, 4]
+        assert all(u.view_id == "a" for u in history)
+        assert store.get_history(view_id="missing") == []
+
+    def test_history_bounded(self):
+        """Should keep at most max_history updates."""
+        store = InMemoryViewStore(max_history=3)
+        for version in range(5):
+            store.record_update(_update("a", version))
+
+        assert [u.version for u in store.get_history()] == [2, 3, 4]
+        assert [u.version for u in store.get_history(view_id="a", limit=10)] == [2, 3, 4]
+        assert store.to_dict()["history_count"] == 3
+
+    def test_view_indexes_bounded(self):
+        """Should not keep per-view history for views evicted from the log."""
+        store = InMemoryViewStore(max_history=3)
+        for version in range(10):
+            store.record_update(_update(f"view-{version}", version))
+
+        assert len(store._view_history) == 3
+        assert store.get_history(view_id="view-0") == []
+
+    def test_history_kept_after_delete(self):
+        """Should keep a deleted view's updates until the log evicts them."""
+        store = InMemoryViewStore(max_history=3)
+        store.save(UIView(id="a", name="A"))
+        store.record_update(_update("a", 1))
+        store.record_update(_update("a", 2))
+
+        store.delete("a")
+
+        assert [u.version for u in store.get_history(view_id="a")] == [1, 2]
+        assert store.get_history() == store.get_history(view_id="a")
+
+        store.save(UIView(id="a", name="A"))
+        store.record_update(_update("a", 3))
+        store.record_update(_update("b", 1))
+
+        assert [u.version for u in store.get_history(view_id="a")] == [2, 3]